@@ -73,6 +73,7 @@ setup(
         "pandas>=2.0.0",
         "requests",
     ],
+    extras_require={"speedups": ["orjson", "ciso8601", "numexpr"]},
     zip_safe=False,
     entry_points={
         "sqlalchemy.dialects": ["datastore = sqlalchemy_datastore:CloudDatastoreDialect"]
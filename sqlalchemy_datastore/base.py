@@ -21,7 +21,7 @@ from typing import Any, List, Optional
 
 from google.cloud import firestore_admin_v1
 from google.oauth2 import service_account
-from sqlalchemy import exc
+from sqlalchemy import event, exc
 from sqlalchemy.engine import Connection, default
 from sqlalchemy.engine.interfaces import (
     ExecutionContext,
@@ -42,6 +42,9 @@ class CloudDatastoreDialect(default.DefaultDialect):
 
     # Datastore capabilities
     supports_alter = False
+    # Compilation uses the default compiler and binds parameters at execute
+    # time, so compiled statements are safe to cache.
+    supports_statement_cache = True
     supports_pk_autoincrement = True
     supports_sequences = False
     supports_comments = False
@@ -86,12 +89,24 @@ class CloudDatastoreDialect(default.DefaultDialect):
         self.database_id = None
         self.list_tables_page_size = list_tables_page_size
         self._client = None
+        self._run_query_session = None
 
     @classmethod
     def dbapi(cls):
         """Return the DBAPI 2.0 driver."""
         return datastore_dbapi
 
+    @classmethod
+    def engine_created(cls, engine):
+        """Close the engine's runQuery session when the engine is disposed."""
+        event.listen(engine, "engine_disposed", cls._close_run_query_session)
+
+    @staticmethod
+    def _close_run_query_session(engine):
+        session = engine.dialect._run_query_session
+        if session is not None:
+            session.close()
+
     def do_ping(self, dbapi_connection):
         """Performs a simple operation to check if the connection is still alive."""
         try:
@@ -164,7 +179,12 @@ class CloudDatastoreDialect(default.DefaultDialect):
         self._client.credentials_info = self.credentials_info
         self._client.credentials_base64 = self.credentials_base64
         self._client.scoped_credentials = credentials
-        return ([], {"client": client})
+        # Every connection of this dialect shares one runQuery session
+        self._run_query_session = datastore_dbapi.RunQuerySession(client)
+        return (
+            [],
+            {"client": client, "run_query_session": self._run_query_session},
+        )
 
     def get_schema_names(self, connection: Connection, **kw) -> List[str]:
         if not isinstance(self.credentials, service_account.Credentials):
@@ -195,11 +215,13 @@ class CloudDatastoreDialect(default.DefaultDialect):
     ) -> List[str]:
         client = self._client
         query = client.query(kind="__kind__")
-        kinds = list(query.fetch())
+        # Only the kind names are needed, and results are consumed as the
+        # pages arrive.
+        query.keys_only()
 
         return [
             name
-            for kind in kinds
+            for kind in query.fetch()
             if (name := getattr(getattr(kind, "key", None), "name", None))
             is not None
             and isinstance(name, str)
@@ -213,17 +235,19 @@ class CloudDatastoreDialect(default.DefaultDialect):
         client = self._client
         query = client.query(kind="__Stat_PropertyType_PropertyName_Kind__")
         query.add_filter("kind_name", "=", table_name)
-        properties = list(query.fetch())
+        # Property types the map doesn't know are reflected as strings
+        property_type = _types._property_type.get
+        default_type = _types._property_type["String"]
 
         return [
             {
                 "name": prop["property_name"],
-                "type": _types._property_type[prop["property_type"]],
+                "type": property_type(prop["property_type"], default_type),
                 "nullable": True,
                 "comment": "",
                 "default": None,
             }
-            for prop in properties
+            for prop in query.fetch()
         ]
 
     def do_execute(
@@ -252,8 +276,18 @@ class CloudDatastoreDialect(default.DefaultDialect):
         schema: str | None = None,
         **kw: Any,
     ) -> bool:
+        if table_name.startswith("__"):
+            # Internal kinds are not reported as tables
+            return False
         try:
-            return table_name in self.get_table_names(connection, schema)
+            # Look the kind up by key instead of listing every kind
+            client = self._client
+            query = client.query(kind="__kind__")
+            query.key_filter(client.key("__kind__", table_name), "=")
+            query.keys_only()
+            return any(
+                kind.key.name == table_name for kind in query.fetch(limit=1)
+            )
         except Exception as e:
             logging.debug(e)
             return False
@@ -16,13 +16,18 @@
 # COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-import base64
 import collections
+import functools
+import importlib.util
 import logging
+import operator
 import os
 import re
+import threading
+from binascii import a2b_base64
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -37,6 +42,20 @@ from sqlglot.tokens import TokenType
 
 from . import _types
 
+# orjson decodes the large runQuery responses considerably faster; the
+# standard library parser is used when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# ciso8601 parses the RFC 3339 timestamps of timestampValue fields in C;
+# datetime.fromisoformat is used when it is not installed.
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:  # pragma: no cover
+    _parse_timestamp = None
+
 logger = logging.getLogger("sqlalchemy.dialects.datastore_dbapi")
 
 apilevel = "2.0"
@@ -108,6 +127,141 @@ type_map = {
     None.__class__: types.String,
 }
 
+# ORM-generated statements repeat verbatim, so their tokens and parse trees
+# are cached by SQL string. The cached results are only read, never mutated.
+_cached_tokenize = functools.lru_cache(maxsize=1024)(tokenize)
+_cached_parse_one = functools.lru_cache(maxsize=1024)(parse_one)
+
+_SELECT_KEYWORD_RE = re.compile(r"\bSELECT\b", re.IGNORECASE)
+_SELECT_STATEMENT_RE = re.compile(r"\s*SELECT\b", re.IGNORECASE)
+
+# Patterns for the client-side WHERE evaluation, compiled once per process.
+_KEY_EQ_RE = re.compile(
+    r"__key__\s*=\s*KEY\s*\(\s*\w+\s*,\s*(?:'([^']*)'|(\d+))\s*\)", re.IGNORECASE
+)
+_BLOB_EQ_RE = re.compile(r"(\w+)\s*=\s*BLOB\s*\('(.*?)'\)", re.IGNORECASE | re.DOTALL)
+_BLOB_NEQ_RE = re.compile(r"(\w+)\s*!=\s*BLOB\s*\('(.*?)'\)", re.IGNORECASE | re.DOTALL)
+_NOT_IN_RE = re.compile(r"(\w+)\s+NOT\s+IN\s+(?:ARRAY\s*)?\(([^)]+)\)", re.IGNORECASE)
+_IN_RE = re.compile(r"(\w+)\s+IN\s+(?:ARRAY\s*)?\(([^)]+)\)", re.IGNORECASE)
+_NEQ_RE = re.compile(r"(\w+)\s*(?:!=|<>)\s*(.+)")
+_ORDERING_RE = re.compile(r"(\w+)\s*(>=|<=|>|<)\s*(.+)")
+_EQ_RE = re.compile(r"(\w+)\s*=\s*(.+)")
+_DATETIME_LITERAL_RE = re.compile(r"DATETIME\s*\(\s*'([^']*)'\s*\)", re.IGNORECASE)
+_FRACTIONAL_SECONDS_RE = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(.*)")
+
+_OR_RE = re.compile(r"\bOR\b", re.IGNORECASE)
+_AND_RE = re.compile(r"\bAND\b", re.IGNORECASE)
+
+# Ordering comparisons share one pattern; the operator is looked up here.
+_ORDERING_OPS = MappingProxyType(
+    {">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt}
+)
+
+
+def _warn_where_failed(where_clause: str, error: Exception) -> None:
+    logging.warning(
+        "Client-side WHERE evaluation failed for clause '%s': %s. "
+        "Row will be excluded (fail closed).",
+        where_clause,
+        error,
+    )
+
+
+def _strip_enclosing_parens(condition: str) -> str:
+    """Drop parentheses that wrap the whole condition, however deeply."""
+    while condition.startswith("(") and condition.endswith(")"):
+        # Find matching paren
+        depth = 0
+        for i, c in enumerate(condition):
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            return condition
+        if i != len(condition) - 1:
+            return condition
+        condition = condition[1:-1].strip()
+    return condition
+
+
+def _combine_predicates(
+    combiner: Callable, predicates: List[Callable[[Dict[str, Any]], bool]]
+) -> Callable[[Dict[str, Any]], bool]:
+    """Join predicates with ``any`` (OR) or ``all`` (AND), short-circuiting."""
+
+    def predicate(context: Dict[str, Any]) -> bool:
+        return combiner(p(context) for p in predicates)
+
+    return predicate
+
+
+# numexpr evaluates computed columns with vectorized kernels when installed.
+_NUMEXPR_AVAILABLE = importlib.util.find_spec("numexpr") is not None
+
+
+_QUOTED_IDENT = re.compile(r'"(\w+)"')
+
+
+@functools.lru_cache(maxsize=256)
+def _column_expression(expr_sql: str) -> str:
+    """Convert a SELECT expression to DataFrame.eval syntax ("col" -> col)."""
+    return _QUOTED_IDENT.sub(r"\1", expr_sql)
+
+
+def _eval_column_expression(df: pd.DataFrame, expr_str: str):
+    """Evaluate a computed column, preferring the numexpr engine."""
+    if _NUMEXPR_AVAILABLE:
+        try:
+            return df.eval(expr_str, engine="numexpr")
+        except Exception as e:
+            # Object columns and some operators are not supported by numexpr
+            logging.debug("numexpr could not evaluate %r: %s", expr_str, e)
+    return df.eval(expr_str, engine="python")
+
+
+def _bound_parameter_name(val_expr, parameters: dict) -> Optional[str]:
+    """Return the parameters key a placeholder or parameter expression names.
+
+    Returns None when the expression names no key in parameters.
+    """
+    if isinstance(val_expr, exp.Placeholder):
+        param_name = val_expr.name or val_expr.this
+        if not param_name:
+            return None
+        if param_name in parameters:
+            return param_name
+        # Handle :name format
+        if param_name.startswith(":") and param_name[1:] in parameters:
+            return param_name[1:]
+        return None
+    try:
+        param_name = val_expr.this.this
+    except AttributeError:
+        param_name = str(val_expr.this)
+    return param_name if param_name in parameters else None
+
+
+# SQLAlchemy type instances are stateless, so the ORM description columns
+# share one instance per type instead of building a new one per column.
+_STRING_TYPE = types.String()
+_INTEGER_TYPE = types.Integer()
+_FLOAT_TYPE = types.Float()
+_BOOLEAN_TYPE = types.Boolean()
+_DATETIME_TYPE = types.DateTime()
+
+# SQLAlchemy type for each NumPy dtype kind; strings, objects and anything
+# else map to String.
+_DTYPE_KIND_TYPES = {
+    "i": _INTEGER_TYPE,
+    "u": _INTEGER_TYPE,
+    "f": _FLOAT_TYPE,
+    "b": _BOOLEAN_TYPE,
+    "M": _DATETIME_TYPE,
+}
+
 
 class Cursor:
     def __init__(self, connection):
@@ -115,8 +269,9 @@ class Cursor:
         self._datastore_client = connection._client
         self.rowcount = -1
         self.arraysize = None
-        self._query_data = None
         self._query_rows = None
+        # Column-wise results of the last plain GQL query, for execute_orm
+        self._query_columns: Optional[Dict[str, List[Any]]] = None
         self._closed = False
         self.description = None
         self.lastrowid = None
@@ -139,19 +294,45 @@ class Cursor:
             self._execute_delete(statements, parameters)
             return
 
-        tokens = tokenize(statements)
-        if self._is_derived_query(tokens):
-            self.execute_orm(statements, parameters, tokens)
-        else:
-            self.gql_query(statements, parameters)
+        # A derived query needs at least two SELECT keywords, so statements
+        # with fewer skip tokenization entirely. Matches inside string
+        # literals can only over-count; the tokenizer makes the final call.
+        if len(_SELECT_KEYWORD_RE.findall(statements)) >= 2:
+            tokens = _cached_tokenize(statements)
+            if self._is_derived_query(tokens):
+                self.execute_orm(statements, parameters, tokens)
+                return
+        self.gql_query(statements, parameters)
+
+    def executemany(self, operation, seq_of_parameters):
+        """Execute an operation once for each parameter set.
+
+        INSERT statements are parsed once and their entities written with
+        put_multi; other statements run through execute() one by one.
+        """
+        if self._closed:
+            raise Error("Cursor is closed.")
+
+        if operation.upper().strip().startswith("INSERT"):
+            self._execute_insert_many(operation, list(seq_of_parameters))
+            return
+
+        rowcount = 0
+        for parameters in seq_of_parameters:
+            self.execute(operation, parameters)
+            rowcount += max(self.rowcount, 0)
+        self.rowcount = rowcount
 
     def _execute_insert(self, statement: str, parameters=None):
         """Execute an INSERT statement using Datastore client."""
         if parameters is None:
             parameters = {}
 
-        logging.debug(f"Executing INSERT: {statement} with parameters: {parameters}")
+        logging.debug("Executing INSERT: %s with parameters: %s", statement, parameters)
+        self._execute_insert_many(statement, [parameters])
 
+    def _execute_insert_many(self, statement: str, seq_of_parameters: List[Any]):
+        """Insert the rows of an INSERT statement for every parameter set."""
         try:
             # Parse INSERT statement using sqlglot
             parsed = parse_one(statement)
@@ -182,47 +363,51 @@ class Cursor:
                     else:
                         columns.append(str(col))
 
-            # Get values
-            values_list = []
+            # Get the value expressions of each VALUES row
+            row_exprs = []
             values_expr = parsed.args.get("expression")
             if values_expr and hasattr(values_expr, "expressions"):
                 for tuple_expr in values_expr.expressions:
                     if hasattr(tuple_expr, "expressions"):
-                        row_values = []
-                        for val in tuple_expr.expressions:
-                            row_values.append(self._parse_insert_value(val, parameters))
-                        values_list.append(row_values)
+                        row_exprs.append(tuple_expr.expressions)
             elif values_expr:
                 # Single row VALUES clause
-                row_values = []
                 if hasattr(values_expr, "expressions"):
-                    for val in values_expr.expressions:
-                        row_values.append(self._parse_insert_value(val, parameters))
-                    values_list.append(row_values)
-
-            # Create entities and insert them
-            entities_created = 0
-            for row_values in values_list:
-                # Create entity key (auto-generated)
-                key = self._datastore_client.key(kind)
-                entity = datastore.Entity(key=key)
-
-                # Set entity properties
-                for i, col in enumerate(columns):
-                    if i < len(row_values):
-                        entity[col] = row_values[i]
-
-                # Put entity to datastore
-                self._datastore_client.put(entity)
-                entities_created += 1
+                    row_exprs.append(values_expr.expressions)
+
+            # Create the entities for every parameter set
+            entities = []
+            for parameters in seq_of_parameters:
+                if parameters is None:
+                    parameters = {}
+                for exprs in row_exprs:
+                    row_values = [
+                        self._parse_insert_value(val, parameters) for val in exprs
+                    ]
+                    # Create entity key (auto-generated)
+                    key = self._datastore_client.key(kind)
+                    entity = datastore.Entity(key=key)
+
+                    # Set entity properties
+                    for i, col in enumerate(columns):
+                        if i < len(row_values):
+                            entity[col] = row_values[i]
+                    entities.append(entity)
+
+            # Datastore accepts at most 500 entities per commit
+            for i in range(0, len(entities), 500):
+                self._datastore_client.put_multi(entities[i : i + 500])
+
+            if entities:
                 # Save the last inserted entity's key ID for lastrowid
-                if entity.key.id is not None:
-                    self.lastrowid = entity.key.id
-                elif entity.key.name is not None:
+                last_key = entities[-1].key
+                if last_key.id is not None:
+                    self.lastrowid = last_key.id
+                elif last_key.name is not None:
                     # For named keys, use a hash of the name as a numeric ID
-                    self.lastrowid = hash(entity.key.name) & 0x7FFFFFFFFFFFFFFF
+                    self.lastrowid = hash(last_key.name) & 0x7FFFFFFFFFFFFFFF
 
-            self.rowcount = entities_created
+            self.rowcount = len(entities)
             self._query_rows = iter([])
             self.description = None
 
@@ -235,7 +420,7 @@ class Cursor:
         if parameters is None:
             parameters = {}
 
-        logging.debug(f"Executing UPDATE: {statement} with parameters: {parameters}")
+        logging.debug("Executing UPDATE: %s with parameters: %s", statement, parameters)
 
         try:
             parsed = parse_one(statement)
@@ -290,7 +475,7 @@ class Cursor:
         if parameters is None:
             parameters = {}
 
-        logging.debug(f"Executing DELETE: {statement} with parameters: {parameters}")
+        logging.debug("Executing DELETE: %s with parameters: %s", statement, parameters)
 
         try:
             parsed = parse_one(statement)
@@ -347,17 +532,9 @@ class Cursor:
         if isinstance(val_expr, exp.Literal):
             if val_expr.is_number:
                 return int(val_expr.this)
-        elif isinstance(val_expr, exp.Placeholder):
-            param_name = val_expr.name or val_expr.this
-            if param_name in parameters:
-                return int(parameters[param_name])
-            if param_name.startswith(":"):
-                param_name = param_name[1:]
-                if param_name in parameters:
-                    return int(parameters[param_name])
-        elif isinstance(val_expr, exp.Parameter):
-            param_name = val_expr.this.this if hasattr(val_expr.this, "this") else str(val_expr.this)
-            if param_name in parameters:
+        elif isinstance(val_expr, (exp.Placeholder, exp.Parameter)):
+            param_name = _bound_parameter_name(val_expr, parameters)
+            if param_name is not None:
                 return int(parameters[param_name])
         return None
 
@@ -376,20 +553,9 @@ class Cursor:
             return None
         elif isinstance(val_expr, exp.Boolean):
             return val_expr.this
-        elif isinstance(val_expr, exp.Placeholder):
-            param_name = val_expr.name or val_expr.this
-            if param_name in parameters:
-                return parameters[param_name]
-            if param_name.startswith(":"):
-                param_name = param_name[1:]
-                if param_name in parameters:
-                    return parameters[param_name]
-            return None
-        elif isinstance(val_expr, exp.Parameter):
-            param_name = val_expr.this.this if hasattr(val_expr.this, "this") else str(val_expr.this)
-            if param_name in parameters:
-                return parameters[param_name]
-            return None
+        elif isinstance(val_expr, (exp.Placeholder, exp.Parameter)):
+            param_name = _bound_parameter_name(val_expr, parameters)
+            return parameters[param_name] if param_name is not None else None
         else:
             return str(val_expr.this) if hasattr(val_expr, "this") else str(val_expr)
 
@@ -408,23 +574,10 @@ class Cursor:
             return None
         elif isinstance(val_expr, exp.Boolean):
             return val_expr.this
-        elif isinstance(val_expr, exp.Placeholder):
+        elif isinstance(val_expr, (exp.Placeholder, exp.Parameter)):
             # Named parameter like :name
-            param_name = val_expr.name or val_expr.this
-            if param_name and param_name in parameters:
-                return parameters[param_name]
-            # Handle :name format
-            if param_name and param_name.startswith(":"):
-                param_name = param_name[1:]
-                if param_name in parameters:
-                    return parameters[param_name]
-            return None
-        elif isinstance(val_expr, exp.Parameter):
-            # Named parameter
-            param_name = val_expr.this.this if hasattr(val_expr.this, "this") else str(val_expr.this)
-            if param_name in parameters:
-                return parameters[param_name]
-            return None
+            param_name = _bound_parameter_name(val_expr, parameters)
+            return parameters[param_name] if param_name is not None else None
         else:
             # Try to get the string representation
             return str(val_expr.this) if hasattr(val_expr, "this") else str(val_expr)
@@ -462,107 +615,19 @@ class Cursor:
                 return True
         return False
 
-    def _parse_aggregation_query(self, statement: str) -> Dict[str, Any]:
+    def _parse_aggregation_query(self, statement: str) -> Mapping[str, Any]:
         """
-        Parse aggregation query and return components.
-        Returns dict with:
-        - 'agg_functions': list of (func_name, column, alias)
+        Parse aggregation query and return components (cached by statement).
+        Returns a read-only mapping with:
+        - 'agg_functions': tuple of (func_name, column, alias)
         - 'base_query': the underlying SELECT query
         - 'is_aggregate_over': whether it's AGGREGATE...OVER syntax
         """
-        upper = statement.upper().strip()
-        result: Dict[str, Any] = {
-            "agg_functions": [],
-            "base_query": None,
-            "is_aggregate_over": False,
-        }
-
-        # Handle AGGREGATE ... OVER (SELECT ...) syntax
-        if upper.startswith("AGGREGATE"):
-            result["is_aggregate_over"] = True
-            # Extract the inner SELECT query
-            over_match = re.search(
-                r"OVER\s*\(\s*(SELECT\s+.+)\s*\)\s*$",
-                statement,
-                re.IGNORECASE | re.DOTALL,
-            )
-            if over_match:
-                result["base_query"] = over_match.group(1).strip()
-            else:
-                # Fallback - extract everything after OVER
-                over_idx = upper.find("OVER")
-                if over_idx > 0:
-                    # Extract content inside parentheses
-                    remaining = statement[over_idx + 4 :].strip()
-                    if remaining.startswith("("):
-                        paren_depth = 0
-                        for i, c in enumerate(remaining):
-                            if c == "(":
-                                paren_depth += 1
-                            elif c == ")":
-                                paren_depth -= 1
-                                if paren_depth == 0:
-                                    result["base_query"] = remaining[1:i].strip()
-                                    break
-
-            # Parse aggregation functions before OVER
-            agg_part = statement[: upper.find("OVER")].strip()
-            if agg_part.upper().startswith("AGGREGATE"):
-                agg_part = agg_part[9:].strip()  # Remove "AGGREGATE"
-            result["agg_functions"] = self._extract_agg_functions(agg_part)
-        else:
-            # Handle SELECT COUNT(*), SUM(col), etc.
-            result["is_aggregate_over"] = False
-            # Parse the SELECT clause to extract aggregation functions
-            select_match = re.match(
-                r"SELECT\s+(.+?)\s+FROM\s+(.+)$", statement, re.IGNORECASE | re.DOTALL
-            )
-            if select_match:
-                select_clause = select_match.group(1)
-                from_clause = select_match.group(2)
-                result["agg_functions"] = self._extract_agg_functions(select_clause)
-                # Build base query to get all data
-                result["base_query"] = f"SELECT * FROM {from_clause}"
-            else:
-                # Handle SELECT without FROM (e.g., SELECT COUNT(*))
-                select_match = re.match(
-                    r"SELECT\s+(.+)$", statement, re.IGNORECASE | re.DOTALL
-                )
-                if select_match:
-                    select_clause = select_match.group(1)
-                    result["agg_functions"] = self._extract_agg_functions(select_clause)
-                    result["base_query"] = None  # No base query for kindless
-
-        return result
+        return _parse_aggregation_query(statement)
 
     def _extract_agg_functions(self, clause: str) -> List[Tuple[str, str, str]]:
         """Extract aggregation functions from a clause."""
-        functions: List[Tuple[str, str, str]] = []
-        # Pattern to match aggregation functions with optional alias
-        patterns = [
-            (
-                r"COUNT_UP_TO\s*\(\s*(\d+)\s*\)(?:\s+AS\s+(\w+))?",
-                "COUNT_UP_TO",
-            ),
-            (r"COUNT\s*\(\s*\*\s*\)(?:\s+AS\s+(\w+))?", "COUNT"),
-            (r"SUM\s*\(\s*(\w+)\s*\)(?:\s+AS\s+(\w+))?", "SUM"),
-            (r"AVG\s*\(\s*(\w+)\s*\)(?:\s+AS\s+(\w+))?", "AVG"),
-        ]
-
-        for pattern, func_name in patterns:
-            for match in re.finditer(pattern, clause, re.IGNORECASE):
-                if func_name == "COUNT":
-                    col = "*"
-                    alias = match.group(1) if match.group(1) else func_name
-                elif func_name == "COUNT_UP_TO":
-                    col = match.group(1)  # The limit number
-                    alias = match.group(2) if match.group(2) else func_name
-                else:
-                    col = match.group(1)
-                    alias = match.group(2) if match.group(2) else func_name
-                functions.append((func_name, col, alias))
-
-        return functions
+        return _extract_agg_functions(clause)
 
     def _compute_aggregations(
         self,
@@ -575,7 +640,7 @@ class Cursor:
         result_fields: Dict[str, Any] = {}
 
         # Get column name to index mapping
-        field_names = list(fields.keys())
+        field_index = {name: i for i, name in enumerate(fields)}
 
         for func_name, col, alias in agg_functions:
             if func_name == "COUNT":
@@ -585,8 +650,8 @@ class Cursor:
                 value = min(len(rows), limit)
             elif func_name in ("SUM", "AVG"):
                 # Find the column index
-                if col in field_names:
-                    col_idx = field_names.index(col)
+                col_idx = field_index.get(col)
+                if col_idx is not None:
                     values = [row[col_idx] for row in rows if row[col_idx] is not None]
                     numeric_values = [v for v in values if isinstance(v, (int, float))]
                     if func_name == "SUM":
@@ -609,36 +674,52 @@ class Cursor:
 
     def _execute_gql_request(self, gql_statement: str) -> Response:
         """Execute a GQL query and return the response."""
-        body = {
-            "gqlQuery": {
-                "queryString": gql_statement,
-                "allowLiterals": True,
-            }
-        }
+        return self._post_run_query(_gql_request_body(gql_statement))
 
-        project_id = self._datastore_client.project
-        if os.getenv("DATASTORE_EMULATOR_HOST") is None:
-            credentials = getattr(
-                self._datastore_client, "scoped_credentials", None
-            )
-            if credentials is None and self._datastore_client.credentials_info:
-                credentials = service_account.Credentials.from_service_account_info(
-                    self._datastore_client.credentials_info,
-                    scopes=["https://www.googleapis.com/auth/datastore"],
-                )
-            if credentials is None:
-                raise ProgrammingError(
-                    "No credentials available for Datastore query. "
-                    "Provide credentials_info, credentials_path, or "
-                    "configure Application Default Credentials."
+    def _collect_entity_results(self, data: dict) -> List[dict]:
+        """Return the entity results of a runQuery response and its later pages.
+
+        Datastore ends a batch with moreResults NOT_FINISHED when it stopped
+        before the query's limit. The remaining pages are requested with the
+        resolved query from the response, starting at the batch's endCursor.
+        """
+        batch = data.get("batch", {})
+        entity_results = batch.get("entityResults", [])
+        query = data.get("query")
+        while (
+            batch.get("moreResults") == "NOT_FINISHED"
+            and batch.get("endCursor")
+            and query is not None
+        ):
+            query = dict(query, startCursor=batch["endCursor"])
+            if "offset" in query:
+                offset = query["offset"] - batch.get("skippedResults", 0)
+                if offset > 0:
+                    query["offset"] = offset
+                else:
+                    del query["offset"]
+            if "limit" in query:
+                limit = query["limit"] - len(batch.get("entityResults", []))
+                if limit <= 0:
+                    break
+                query["limit"] = limit
+
+            response = self._post_run_query({"query": query})
+            if response.status_code != 200:
+                raise OperationalError(
+                    f"Fetching the next query page failed: {response.text}"
                 )
-            authed_session = AuthorizedSession(credentials)
-            url = f"https://datastore.googleapis.com/v1/projects/{project_id}:runQuery"
-            return authed_session.post(url, json=body)
-        else:
-            host = os.environ["DATASTORE_EMULATOR_HOST"]
-            url = f"http://{host}/v1/projects/{project_id}:runQuery"
-            return requests.post(url, json=body)
+            batch = _json_loads(response.content).get("batch", {})
+            entity_results.extend(batch.get("entityResults", []))
+        return entity_results
+
+    def _post_run_query(self, body: dict) -> Response:
+        """Post a runQuery request body and return the response."""
+        session = self.connection._get_session()
+        url = _run_query_url(
+            self._datastore_client.project, os.getenv("DATASTORE_EMULATOR_HOST")
+        )
+        return session.post(url, json=body)
 
     def _needs_client_side_filter(self, statement: str) -> bool:
         """Check if the query needs client-side filtering due to unsupported ops.
@@ -681,7 +762,7 @@ class Cursor:
         if response.status_code not in (400, 409):
             return False
         try:
-            body = response.json()
+            body = _json_loads(response.content)
             error = body.get("error", {})
             message = error.get("message", "").lower()
             status = error.get("status", "")
@@ -760,12 +841,15 @@ class Cursor:
             return rows
         from functools import cmp_to_key
 
-        field_names = list(fields.keys())
+        # Resolve each ORDER BY column to its row index once, not per comparison
+        field_index = {name: i for i, name in enumerate(fields)}
+        order_indexes = [
+            (field_index.get(col_name), ascending) for col_name, ascending in order_keys
+        ]
 
         def compare_rows(row_a: Tuple, row_b: Tuple) -> int:
-            for col_name, ascending in order_keys:
-                if col_name in field_names:
-                    idx = field_names.index(col_name)
+            for idx, ascending in order_indexes:
+                if idx is not None:
                     val_a = row_a[idx] if idx < len(row_a) else None
                     val_b = row_b[idx] if idx < len(row_b) else None
                 else:
@@ -820,11 +904,9 @@ class Cursor:
                 f"(original: {gql_statement})"
             )
 
-        data = response.json()
-        entity_results = data.get("batch", {}).get("entityResults", [])
+        entity_results = self._collect_entity_results(_json_loads(response.content))
 
         # Initialize cursor state for empty result
-        self._query_data = iter([])
         self._query_rows = iter([])
         self.rowcount = 0
         self.description = [(None, None, None, None, None, None, None)]
@@ -859,7 +941,7 @@ class Cursor:
         # Project to requested columns if the original query specified them
         selected_columns = self._parse_select_columns(original_statement)
         if selected_columns is not None:
-            field_names = list(fields.keys())
+            field_index = {name: i for i, name in enumerate(fields)}
             projected_rows: List[Tuple] = []
             projected_fields: Dict[str, Any] = {}
 
@@ -870,23 +952,25 @@ class Cursor:
                 elif col in fields:
                     projected_fields[col] = fields[col]
 
+            # Resolve each selected column to its row index once
+            indexes = [
+                field_index.get(
+                    "key" if col.lower() in ("__key__", "key") else col
+                )
+                for col in selected_columns
+            ]
             for row in rows:
-                new_row: List[Any] = []
-                for col in selected_columns:
-                    col_lower = col.lower()
-                    lookup = "key" if col_lower in ("__key__", "key") else col
-                    if lookup in field_names:
-                        idx = field_names.index(lookup)
-                        new_row.append(row[idx] if idx < len(row) else None)
-                    else:
-                        new_row.append(None)
-                projected_rows.append(tuple(new_row))
+                projected_rows.append(
+                    tuple(
+                        row[idx] if idx is not None and idx < len(row) else None
+                        for idx in indexes
+                    )
+                )
 
             rows = projected_rows
             fields = projected_fields
 
         fields_list = list(fields.values())
-        self._query_data = iter(rows)
         self._query_rows = iter(rows)
         self.rowcount = len(rows)
         self.description = fields_list if fields_list else None
@@ -911,72 +995,90 @@ class Cursor:
 
         where_clause = statement[where_idx + 7 : end_idx].strip()
         field_names = list(fields.keys())
+        # Split the clause once; every row reuses the compiled predicate
+        try:
+            predicate = self._compile_condition(where_clause)
+        except Exception as e:
+            _warn_where_failed(where_clause, e)
+            return []
 
         # Apply filter
         filtered_rows = []
         for row in rows:
-            if self._evaluate_where(row, field_names, where_clause):
+            if self._evaluate_where(row, field_names, where_clause, predicate):
                 filtered_rows.append(row)
         return filtered_rows
 
     def _evaluate_where(
-        self, row: Tuple, field_names: List[str], where_clause: str
+        self,
+        row: Tuple,
+        field_names: List[str],
+        where_clause: str,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> bool:
         """Evaluate WHERE clause against a row. Returns True if row matches."""
-        # Build a context dict from the row
-        context = {}
-        for i, name in enumerate(field_names):
-            if i < len(row):
-                context[name] = row[i]
+        # Build a context dict from the row; a row shorter or longer than the
+        # field names is still evaluated on the fields it has
+        context = dict(zip(field_names, row, strict=False))
 
         # Parse and evaluate the WHERE clause
         # This is a simplified evaluator for common patterns
         try:
-            return self._eval_condition(context, where_clause)
+            if predicate is None:
+                predicate = self._compile_condition(where_clause)
+            return predicate(context)
         except Exception as e:
-            logging.warning(
-                "Client-side WHERE evaluation failed for clause '%s': %s. "
-                "Row will be excluded (fail closed).",
-                where_clause,
-                e,
-            )
+            _warn_where_failed(where_clause, e)
             return False
 
     def _eval_condition(self, context: Dict[str, Any], condition: str) -> bool:
         """Evaluate a single condition or compound condition."""
-        condition = condition.strip()
+        return self._compile_condition(condition)(context)
 
-        # Handle parentheses
-        if condition.startswith("(") and condition.endswith(")"):
-            # Find matching paren
-            depth = 0
-            for i, c in enumerate(condition):
-                if c == "(":
-                    depth += 1
-                elif c == ")":
-                    depth -= 1
-                    if depth == 0:
-                        if i == len(condition) - 1:
-                            return self._eval_condition(context, condition[1:-1])
-                        break
-
-        # Handle OR (lower precedence)
-        or_match = re.search(r"\bOR\b", condition, re.IGNORECASE)
-        if or_match:
-            # Split on OR, but respect parentheses
-            parts = self._split_on_operator(condition, "OR")
-            if len(parts) > 1:
-                return any(self._eval_condition(context, p) for p in parts)
+    def _compile_condition(
+        self, condition: str
+    ) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a condition into a predicate over a row context.
+
+        OR binds looser than AND and parentheses group. The clause is split
+        with an explicit stack rather than by recursion, so deeply nested
+        clauses neither re-split per row nor hit the recursion limit.
+        """
+        root: List[Any] = [None]
+        pending = [(condition, root, 0)]
+        # (combiner, children, target, index) in the order they were opened
+        compound: List[Tuple[Callable, List[Any], List[Any], int]] = []
+        while pending:
+            text, target, index = pending.pop()
+            text = _strip_enclosing_parens(text.strip())
+
+            parts: List[str] = []
+            combiner: Callable = any
+            # Handle OR (lower precedence)
+            if _OR_RE.search(text):
+                parts = self._split_on_operator(text, "OR")
+            # Handle AND (higher precedence)
+            if len(parts) <= 1 and _AND_RE.search(text):
+                parts = self._split_on_operator(text, "AND")
+                combiner = all
 
-        # Handle AND (higher precedence)
-        and_match = re.search(r"\bAND\b", condition, re.IGNORECASE)
-        if and_match:
-            parts = self._split_on_operator(condition, "AND")
             if len(parts) > 1:
-                return all(self._eval_condition(context, p) for p in parts)
+                children: List[Any] = [None] * len(parts)
+                compound.append((combiner, children, target, index))
+                pending.extend(
+                    (part, children, i) for i, part in enumerate(parts)
+                )
+            else:
+                # Handle simple comparisons
+                target[index] = functools.partial(
+                    self._eval_simple_condition, condition=text
+                )
 
-        # Handle simple comparisons
-        return self._eval_simple_condition(context, condition)
+        # Children are opened after their parents, so closing in reverse
+        # order always finds every child predicate already built.
+        for combiner, children, target, index in reversed(compound):
+            target[index] = _combine_predicates(combiner, children)
+        return root[0]
 
     def _split_on_operator(self, condition: str, operator: str) -> List[str]:
         """Split condition on operator while respecting parentheses."""
@@ -1015,11 +1117,7 @@ class Cursor:
 
         # Handle __key__ = KEY(kind, value) comparison
         # Entity key is stored as "key" in context (from ParseEntity)
-        key_eq_match = re.match(
-            r"__key__\s*=\s*KEY\s*\(\s*\w+\s*,\s*(?:'([^']*)'|(\d+))\s*\)",
-            condition,
-            re.IGNORECASE,
-        )
+        key_eq_match = _KEY_EQ_RE.match(condition)
         if key_eq_match:
             key_name = key_eq_match.group(1)
             key_id = key_eq_match.group(2)
@@ -1035,11 +1133,7 @@ class Cursor:
 
         # Handle BLOB equality (before generic handlers, since BLOB literal
         # would confuse the generic _parse_literal path)
-        blob_eq_match = re.match(
-            r"(\w+)\s*=\s*BLOB\s*\('(.*?)'\)",
-            condition,
-            re.IGNORECASE | re.DOTALL,
-        )
+        blob_eq_match = _BLOB_EQ_RE.match(condition)
         if blob_eq_match:
             field = blob_eq_match.group(1)
             blob_str = blob_eq_match.group(2)
@@ -1053,11 +1147,7 @@ class Cursor:
             return False
 
         # Handle BLOB inequality
-        blob_neq_match = re.match(
-            r"(\w+)\s*!=\s*BLOB\s*\('(.*?)'\)",
-            condition,
-            re.IGNORECASE | re.DOTALL,
-        )
+        blob_neq_match = _BLOB_NEQ_RE.match(condition)
         if blob_neq_match:
             field = blob_neq_match.group(1)
             blob_str = blob_neq_match.group(2)
@@ -1071,10 +1161,7 @@ class Cursor:
             return True
 
         # Handle NOT IN / NOT IN ARRAY
-        not_in_match = re.match(
-            r"(\w+)\s+NOT\s+IN\s+(?:ARRAY\s*)?\(([^)]+)\)",
-            condition, re.IGNORECASE,
-        )
+        not_in_match = _NOT_IN_RE.match(condition)
         if not_in_match:
             field = not_in_match.group(1)
             values_str = not_in_match.group(2)
@@ -1083,10 +1170,7 @@ class Cursor:
             return field_val not in values
 
         # Handle IN / IN ARRAY
-        in_match = re.match(
-            r"(\w+)\s+IN\s+(?:ARRAY\s*)?\(([^)]+)\)",
-            condition, re.IGNORECASE,
-        )
+        in_match = _IN_RE.match(condition)
         if in_match:
             field = in_match.group(1)
             values_str = in_match.group(2)
@@ -1095,67 +1179,28 @@ class Cursor:
             return field_val in values
 
         # Handle != and <>
-        neq_match = re.match(r"(\w+)\s*(?:!=|<>)\s*(.+)", condition, re.IGNORECASE)
+        neq_match = _NEQ_RE.match(condition)
         if neq_match:
             field = neq_match.group(1)
             value = self._parse_literal(neq_match.group(2).strip())
             field_val = context.get(field)
             return field_val != value
 
-        # Handle >=
-        gte_match = re.match(r"(\w+)\s*>=\s*(.+)", condition)
-        if gte_match:
-            field = gte_match.group(1)
-            value = self._parse_literal(gte_match.group(2).strip())
-            field_val = context.get(field)
-            if field_val is not None and value is not None:
-                try:
-                    return field_val >= value
-                except TypeError:
-                    return False
-            return False
-
-        # Handle <=
-        lte_match = re.match(r"(\w+)\s*<=\s*(.+)", condition)
-        if lte_match:
-            field = lte_match.group(1)
-            value = self._parse_literal(lte_match.group(2).strip())
+        # Handle >=, <=, > and <
+        ordering_match = _ORDERING_RE.match(condition)
+        if ordering_match:
+            field, op, literal = ordering_match.groups()
+            value = self._parse_literal(literal.strip())
             field_val = context.get(field)
             if field_val is not None and value is not None:
                 try:
-                    return field_val <= value
-                except TypeError:
-                    return False
-            return False
-
-        # Handle >
-        gt_match = re.match(r"(\w+)\s*>\s*(.+)", condition)
-        if gt_match:
-            field = gt_match.group(1)
-            value = self._parse_literal(gt_match.group(2).strip())
-            field_val = context.get(field)
-            if field_val is not None and value is not None:
-                try:
-                    return field_val > value
-                except TypeError:
-                    return False
-            return False
-
-        # Handle <
-        lt_match = re.match(r"(\w+)\s*<\s*(.+)", condition)
-        if lt_match:
-            field = lt_match.group(1)
-            value = self._parse_literal(lt_match.group(2).strip())
-            field_val = context.get(field)
-            if field_val is not None and value is not None:
-                try:
-                    return field_val < value
+                    return _ORDERING_OPS[op](field_val, value)
                 except TypeError:
                     return False
             return False
 
         # Handle =
-        eq_match = re.match(r"(\w+)\s*=\s*(.+)", condition)
+        eq_match = _EQ_RE.match(condition)
         if eq_match:
             field = eq_match.group(1)
             value = self._parse_literal(eq_match.group(2).strip())
@@ -1176,19 +1221,14 @@ class Cursor:
         """Parse a literal value from string."""
         literal = literal.strip()
         # DATETIME literal: DATETIME('2023-01-01T00:00:00Z')
-        datetime_match = re.match(
-            r"DATETIME\s*\(\s*'([^']*)'\s*\)", literal, re.IGNORECASE
-        )
+        datetime_match = _DATETIME_LITERAL_RE.match(literal)
         if datetime_match:
             timestamp_str = datetime_match.group(1)
             if timestamp_str.endswith("Z"):
                 timestamp_str = timestamp_str.replace("Z", "+00:00")
             # Normalize fractional seconds to 6 digits for Python 3.10
             # compatibility (fromisoformat only handles 0, 3, or 6 digits).
-            frac_match = re.match(
-                r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(.*)",
-                timestamp_str,
-            )
+            frac_match = _FRACTIONAL_SECONDS_RE.match(timestamp_str)
             if frac_match:
                 frac = frac_match.group(2)[:6].ljust(6, "0")
                 timestamp_str = (
@@ -1348,6 +1388,7 @@ class Cursor:
 
     def gql_query(self, statement, parameters=None, **kwargs):
         """Execute a GQL query with support for aggregations."""
+        self._query_columns = None
 
         # Check for ORM-style queries with table.id in WHERE clause
         if parameters and self._is_orm_id_query(statement):
@@ -1358,15 +1399,16 @@ class Cursor:
         if parameters:
             statement = self._substitute_parameters(statement, parameters)
 
-        # Convert SQL to GQL-compatible format
-        gql_statement = self._convert_sql_to_gql(statement)
-        logging.debug(f"Converted GQL statement: {gql_statement}")
-
-        # Check if this is an aggregation query
+        # Check if this is an aggregation query. Aggregations build their own
+        # base query, so only the remaining path needs the GQL conversion.
         if self._is_aggregation_query(statement):
             self._execute_aggregation_query(statement, parameters)
             return
 
+        # Convert SQL to GQL-compatible format
+        gql_statement = self._convert_sql_to_gql(statement)
+        logging.debug("Converted GQL statement: %s", gql_statement)
+
         # Check if we need client-side filtering (check converted GQL)
         needs_filter = self._needs_client_side_filter(gql_statement)
         if needs_filter:
@@ -1378,8 +1420,7 @@ class Cursor:
         response = self._execute_gql_request(gql_statement)
 
         if response.status_code == 200:
-            data = response.json()
-            logging.debug(data)
+            data = _json_loads(response.content)
         else:
             # Fall back to client-side processing for any GQL failure.
             # The emulator may return 400 (INVALID_ARGUMENT for !=, NOT IN,
@@ -1400,21 +1441,18 @@ class Cursor:
             self._execute_fallback_query(statement, statement)
             return
 
-        self._query_data = iter([])
-        self._query_rows = iter([])
-        self.rowcount = 0
-        self.description = [(None, None, None, None, None, None, None)]
         self._last_executed = statement
         self._parameters = parameters or {}
 
-        data = data.get("batch", {}).get("entityResults", [])
+        data = self._collect_entity_results(data)
         if len(data) == 0:
-            return  # Everything is already set for an empty result
+            self._query_rows = iter([])
+            self.rowcount = 0
+            self.description = [(None, None, None, None, None, None, None)]
+            return
 
         # Determine if this statement is expected to return rows (e.g., SELECT)
-        # You'll need a way to figure this out based on 'statement' or a flag passed to your custom execute method.
-        # Example (simplified check, you might need a more robust parsing or flag):
-        is_select_statement = statement.upper().strip().startswith("SELECT")
+        is_select_statement = _SELECT_STATEMENT_RE.match(statement) is not None
 
         if is_select_statement:
             self._closed = False  # For SELECT, cursor should remain open to fetch rows
@@ -1422,25 +1460,40 @@ class Cursor:
             # Parse the SELECT statement to get column list
             selected_columns = self._parse_select_columns(statement)
 
-            rows, fields = ParseEntity.parse(data, selected_columns)
+            columns, fields = ParseEntity.parse_columns(data, selected_columns)
 
             # Apply client-side filtering if needed.
             # Use the original statement (not the converted GQL) to preserve
             # binary data inside BLOB literals that whitespace normalization
             # in _convert_sql_to_gql would corrupt.
             if needs_filter:
+                if columns:
+                    rows: List[Tuple] = list(zip(*columns.values(), strict=True))
+                else:
+                    rows = [()] * len(data)
                 rows = self._apply_client_side_filter(rows, fields, statement)
+                self._query_rows = iter(rows)
+                self.rowcount = len(rows)
+            else:
+                # Unfiltered columns line up with the rows, so execute_orm
+                # can build its DataFrame from them without transposing.
+                self._query_columns = columns
+                # Rows are zipped from the columns only as they are fetched
+                if columns:
+                    self._query_rows = zip(*columns.values(), strict=True)
+                else:
+                    self._query_rows = iter([()] * len(data))
+                self.rowcount = len(data)
 
             fields = list(fields.values())
-            self._query_data = iter(rows)
-            self._query_rows = iter(rows)
-            self.rowcount = len(rows)
             self.description = fields if len(fields) > 0 else None
         else:
             # For INSERT/UPDATE/DELETE, the operation is complete, no rows to yield
             # For INSERT/UPDATE/DELETE, the operation is complete, set rowcount if possible
             affected_count = len(data) if isinstance(data, list) else 0
+            self._query_rows = iter([])
             self.rowcount = affected_count
+            self.description = [(None, None, None, None, None, None, None)]
             self._closed = True
 
     def _execute_aggregation_query(self, statement: str, parameters=None):
@@ -1507,10 +1560,7 @@ class Cursor:
                     f"Aggregation fallback query failed: "
                     f"{fallback_query} (original: {statement})"
                 )
-            fb_data = response.json()
-            fb_results = fb_data.get("batch", {}).get(
-                "entityResults", []
-            )
+            fb_results = self._collect_entity_results(_json_loads(response.content))
             if not fb_results:
                 result_values: List[Any] = []
                 result_fields: Dict[str, Any] = {}
@@ -1535,8 +1585,7 @@ class Cursor:
             self.description = list(agg_fields.values())
             return
 
-        data = response.json()
-        entity_results = data.get("batch", {}).get("entityResults", [])
+        entity_results = self._collect_entity_results(_json_loads(response.content))
 
         if len(entity_results) == 0:
             # No data - return aggregations with 0 values
@@ -1581,11 +1630,13 @@ class Cursor:
             tokens = []
 
         logging.debug(
-            f"[DataStore DBAPI] Executing ORM query: {statement} with parameters: {parameters}"
+            "[DataStore DBAPI] Executing ORM query: %s with parameters: %s",
+            statement,
+            parameters,
         )
 
         statement = statement.replace("`", "'")
-        parsed = parse_one(statement)
+        parsed = _cached_parse_one(statement)
         # Note: sqlglot uses "from_" as the key, not "from"
         from_arg = parsed.args.get("from") or parsed.args.get("from_")
         if not isinstance(parsed, exp.Select) or not from_arg:
@@ -1599,25 +1650,31 @@ class Cursor:
 
         # 1. Query the subquery table
         self.gql_query(subquery_sql)
-        subquery_results = self.fetchall()
         subquery_description = self.description
 
+        # Plain projections of the subquery need no DataFrame round trip
+        if self._is_plain_projection(parsed):
+            self._execute_orm_projection(parsed, subquery_description)
+            return
+
         # 2. Turn to pandas dataframe
-        if not subquery_description:
-            df = pd.DataFrame(subquery_results)
+        if self._query_columns:
+            df = pd.DataFrame(self._query_columns)
+        elif not subquery_description:
+            df = pd.DataFrame(self.fetchall())
         else:
             column_names = [col[0] for col in subquery_description]
-            df = pd.DataFrame(subquery_results, columns=column_names)
+            df = pd.DataFrame(self.fetchall(), columns=column_names)
 
         # Add computed columns from SELECT expressions before grouping or ordering
         for p in parsed.expressions:
             if isinstance(p, exp.Alias) and not p.find(exp.AggFunc):
                 # This is a simplified expression evaluator for computed columns.
                 # It converts "col" to col and leaves other things as is.
-                expr_str = re.sub(r'"(\w+)"', r"\1", p.this.sql())
+                expr_str = _column_expression(p.this.sql())
                 try:
                     # Use assign to add new columns based on expressions
-                    df = df.assign(**{p.alias: df.eval(expr_str, engine="python")})
+                    df = df.assign(**{p.alias: _eval_column_expression(df, expr_str)})
                 except Exception as e:
                     logging.warning(f"Could not evaluate expression '{expr_str}': {e}")
 
@@ -1672,7 +1729,8 @@ class Cursor:
                         )
                         df[col] = converted_cols[col]
 
-            col_renames = {}
+            # Named aggregations for a single groupby pass: alias -> (column, func)
+            agg_spec: Dict[str, Tuple[str, str]] = {}
             for p in parsed.expressions:
                 if isinstance(p, exp.Alias) and p.find(exp.AggFunc):
                     agg_func = p.this
@@ -1701,14 +1759,10 @@ class Cursor:
                     else:
                         # Fallback for unknown structures
                         original_col_name = group_by_cols[0]
-                    desired_sql_alias = p.alias_or_name
-                    col_renames = {"temp_agg": desired_sql_alias}
-                    df = (
-                        df.groupby(group_by_cols)
-                        .agg(temp_agg=(original_col_name, agg_func_name))
-                        .reset_index()
-                        .rename(columns=col_renames)
-                    )
+                    agg_spec[p.alias_or_name] = (original_col_name, agg_func_name)
+
+            if agg_spec:
+                df = df.groupby(group_by_cols).agg(**agg_spec).reset_index()
 
         elif has_agg:
             # Aggregation without GROUP BY (e.g., SELECT COUNT(*) FROM table)
@@ -1778,9 +1832,59 @@ class Cursor:
             df = df[[col for col in final_columns if col in df.columns]]
 
         # Finalize results
-        rows = [tuple(x) for x in df.to_numpy()]
         schema = self._create_schema_from_df(df)
-        self.rowcount = len(rows) if rows else 0
+        self.rowcount = len(df)
+        self._set_description(schema)
+        # Rows are read out of the DataFrame only as they are fetched
+        self._query_rows = df.itertuples(index=False, name=None)
+
+    def _is_plain_projection(self, parsed: exp.Select) -> bool:
+        """Check if a derived query only selects or renames subquery columns."""
+        if parsed.args.get("group") or parsed.args.get("order"):
+            return False
+        if all(isinstance(p, exp.Star) for p in parsed.expressions):
+            return True
+        return all(
+            isinstance(p, exp.Column)
+            or (isinstance(p, exp.Alias) and isinstance(p.this, exp.Column))
+            for p in parsed.expressions
+        )
+
+    def _execute_orm_projection(self, parsed: exp.Select, subquery_description):
+        """Project the subquery rows of a plain derived query directly."""
+        rows = self.fetchall()
+        if parsed.args.get("limit"):
+            limit = int(parsed.args["limit"].expression.sql())
+            rows = rows[:limit]
+
+        if all(isinstance(p, exp.Star) for p in parsed.expressions):
+            schema = tuple(subquery_description or ())
+        else:
+            positions: Dict[str, int] = {}
+            for i, col in enumerate(subquery_description or ()):
+                positions.setdefault(col[0], i)
+            indexes = []
+            description = []
+            for p in parsed.expressions:
+                source = p.this.name if isinstance(p, exp.Alias) else p.name
+                if source not in positions:
+                    continue
+                index = positions[source]
+                indexes.append(index)
+                description.append(
+                    (p.alias_or_name,) + tuple(subquery_description[index][1:])
+                )
+            if len(indexes) == 1:
+                index = indexes[0]
+                rows = [(row[index],) for row in rows]
+            elif indexes:
+                getter = operator.itemgetter(*indexes)
+                rows = [getter(row) for row in rows]
+            else:
+                rows = [()] * len(rows)
+            schema = tuple(description)
+
+        self.rowcount = len(rows)
         self._set_description(schema)
         self._query_rows = iter(rows)
 
@@ -1788,30 +1892,10 @@ class Cursor:
         """Create schema from a pandas DataFrame."""
         schema = []
         for col_name, dtype in df.dtypes.items():
-            if pd.api.types.is_string_dtype(dtype):
-                sa_type = types.String
-            elif pd.api.types.is_integer_dtype(dtype):
-                sa_type = types.Integer
-            elif pd.api.types.is_float_dtype(dtype):
-                sa_type = types.Float
-            elif pd.api.types.is_bool_dtype(dtype):
-                sa_type = types.Boolean
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                sa_type = types.DateTime
-            else:
-                sa_type = types.String  # Fallback
-
-            schema.append(
-                Column(
-                    name=col_name,
-                    type_code=sa_type(),
-                    display_size=None,
-                    internal_size=None,
-                    precision=None,
-                    scale=None,
-                    null_ok=True,
-                )
-            )
+            sa_type = _DTYPE_KIND_TYPES.get(dtype.kind, _STRING_TYPE)
+
+            # Positional arguments skip the keyword matching in Column.__new__.
+            schema.append(Column(col_name, sa_type, None, None, None, None, True))
         return tuple(schema)
 
     def _set_description(self, schema: tuple = ()):
@@ -1893,239 +1977,419 @@ class Cursor:
             return None
 
     def _convert_sql_to_gql(self, statement: str) -> str:
-        """
-        Convert SQL statements to GQL-compatible format.
+        """Convert SQL statements to GQL-compatible format.
 
-        GQL (Google Query Language) is similar to SQL but has its own syntax.
-        This method reverses transformations applied by Superset's sqlglot
-        processing (BigQuery dialect) and makes other adjustments for GQL
-        compatibility.
+        Repeats of an identical statement, literals included, are cached.
         """
-        # AGGREGATE queries are valid GQL - pass through directly
-        if statement.strip().upper().startswith("AGGREGATE"):
-            return statement
+        return _convert_sql_to_gql(statement)
 
-        # Normalize whitespace: sqlglot pretty-prints with newlines which
-        # breaks position-based string operations (find, regex).
-        statement = re.sub(r"\s+", " ", statement).strip()
+    def close(self):
+        self._closed = True
+        self.connection = None
+        logging.debug("Cursor is closed.")
 
-        # === Reverse sqlglot / BigQuery dialect transformations ===
 
-        # 1. Convert <> back to != (sqlglot BigQuery dialect converts != to <>)
-        #    GQL uses != for not-equals comparisons.
-        statement = re.sub(r"<>", "!=", statement)
+# Statements arrive with their parameter values already substituted, so only
+# byte-identical statements hit this cache; queries that differ by a literal
+# each take an entry. Kept small so it doesn't hold many user values.
+@functools.lru_cache(maxsize=64)
+def _convert_sql_to_gql(statement: str) -> str:
+    """
+    Convert SQL statements to GQL-compatible format.
+
+    GQL (Google Query Language) is similar to SQL but has its own syntax.
+    This function reverses transformations applied by Superset's sqlglot
+    processing (BigQuery dialect) and makes other adjustments for GQL
+    compatibility. The conversion only depends on the statement text, so
+    results are cached for the repeated statements an ORM issues.
+    """
+    # AGGREGATE queries are valid GQL - pass through directly
+    if statement.strip().upper().startswith("AGGREGATE"):
+        return statement
 
-        # 2. Fix NOT ... IN -> ... NOT IN
-        #    sqlglot converts "col NOT IN (...)" to "NOT col IN (...)"
-        #    GQL expects "col NOT IN (...)"
+    # Normalize whitespace: sqlglot pretty-prints with newlines which
+    # breaks position-based string operations (find, regex).
+    statement = re.sub(r"\s+", " ", statement).strip()
+
+    # === Reverse sqlglot / BigQuery dialect transformations ===
+
+    # 1. Convert <> back to != (sqlglot BigQuery dialect converts != to <>)
+    #    GQL uses != for not-equals comparisons.
+    statement = re.sub(r"<>", "!=", statement)
+
+    # 2. Fix NOT ... IN -> ... NOT IN
+    #    sqlglot converts "col NOT IN (...)" to "NOT col IN (...)"
+    #    GQL expects "col NOT IN (...)"
+    statement = re.sub(
+        r"\bNOT\s+(\w+)\s+IN\s*\(",
+        r"\1 NOT IN (",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    # 3. Strip ROW_NUMBER() OVER (...) added by sqlglot for DISTINCT ON
+    #    BigQuery dialect converts "SELECT DISTINCT ON (col) * FROM t"
+    #    to "SELECT *, ROW_NUMBER() OVER (PARTITION BY col ...) AS _row_... FROM t"
+    #    We strip the ROW_NUMBER expression and any trailing WHERE _row_... = 1
+    statement = re.sub(
+        r",\s*ROW_NUMBER\s*\(\s*\)\s*OVER\s*\([^)]*\)\s*(?:AS\s+\w+)?",
+        "",
+        statement,
+        flags=re.IGNORECASE,
+    )
+    # Also remove the WHERE _row_number = 1 subquery wrapper if present
+    statement = re.sub(
+        r"\bWHERE\s+_row_\w+\s*=\s*1\b",
+        "",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    # 4. Fix IN clause syntax for GQL
+    #    a) Convert square bracket arrays: IN ['val'] -> IN ARRAY('val')
+    #    b) Convert parenthesized lists: IN ('val1', 'val2') -> IN ARRAY('val1', 'val2')
+    #    GQL requires the ARRAY keyword: "name IN ARRAY('val1', 'val2')"
+    #    NOT IN also needs: "name NOT IN ARRAY('val1', 'val2')"
+    statement = re.sub(
+        r"\bIN\s*\[([^\]]*)\]",
+        r"IN ARRAY(\1)",
+        statement,
+        flags=re.IGNORECASE,
+    )
+    # Convert IN (...) to IN ARRAY(...) but don't double-convert IN ARRAY(...)
+    statement = re.sub(
+        r"\bIN\s*\((?![\s]*SELECT\b)",
+        "IN ARRAY(",
+        statement,
+        flags=re.IGNORECASE,
+    )
+    # Fix double ARRAY: if original was already ARRAY, we'd get IN ARRAY(ARRAY(...)
+    statement = re.sub(
+        r"\bARRAY\s*\(\s*ARRAY\s*\(",
+        "ARRAY(",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    # 5. Fix WHERE NULL (from sqlglot optimizing "col = NULL" to "NULL")
+    #    sqlglot treats "col = NULL" as always-false and collapses to NULL.
+    #    We can't recover the original column, but if the WHERE clause is
+    #    just "WHERE NULL", remove it since it would return no results.
+    statement = re.sub(
+        r"\bWHERE\s+NULL\b",
+        "",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    # === GQL-specific transformations ===
+
+    # Handle LIMIT FIRST(offset, count) syntax
+    # Convert to LIMIT <count> OFFSET <offset>
+    first_match = re.search(
+        r"LIMIT\s+FIRST\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)",
+        statement,
+        flags=re.IGNORECASE,
+    )
+    if first_match:
+        offset = first_match.group(1)
+        count = first_match.group(2)
         statement = re.sub(
-            r"\bNOT\s+(\w+)\s+IN\s*\(",
-            r"\1 NOT IN (",
+            r"LIMIT\s+FIRST\s*\(\s*\d+\s*,\s*\d+\s*\)",
+            f"LIMIT {count} OFFSET {offset}",
             statement,
             flags=re.IGNORECASE,
         )
 
-        # 3. Strip ROW_NUMBER() OVER (...) added by sqlglot for DISTINCT ON
-        #    BigQuery dialect converts "SELECT DISTINCT ON (col) * FROM t"
-        #    to "SELECT *, ROW_NUMBER() OVER (PARTITION BY col ...) AS _row_... FROM t"
-        #    We strip the ROW_NUMBER expression and any trailing WHERE _row_... = 1
-        statement = re.sub(
-            r",\s*ROW_NUMBER\s*\(\s*\)\s*OVER\s*\([^)]*\)\s*(?:AS\s+\w+)?",
-            "",
-            statement,
-            flags=re.IGNORECASE,
-        )
-        # Also remove the WHERE _row_number = 1 subquery wrapper if present
+    # Extract table name from FROM clause for KEY() conversion
+    table_match = re.search(
+        r"\bFROM\s+(\w+)", statement, flags=re.IGNORECASE
+    )
+    table_name = table_match.group(1) if table_match else None
+
+    # Remove DISTINCT ON (...) syntax - not supported by GQL.
+    # GQL supports DISTINCT but not DISTINCT ON.
+    statement = re.sub(
+        r"\bDISTINCT\s+ON\s*\([^)]*\)\s*",
+        "",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    # Convert table.id in SELECT clause to __key__
+    if table_name:
         statement = re.sub(
-            r"\bWHERE\s+_row_\w+\s*=\s*1\b",
-            "",
+            rf"\b{table_name}\.id\b",
+            "__key__",
             statement,
             flags=re.IGNORECASE,
         )
 
-        # 4. Fix IN clause syntax for GQL
-        #    a) Convert square bracket arrays: IN ['val'] -> IN ARRAY('val')
-        #    b) Convert parenthesized lists: IN ('val1', 'val2') -> IN ARRAY('val1', 'val2')
-        #    GQL requires the ARRAY keyword: "name IN ARRAY('val1', 'val2')"
-        #    NOT IN also needs: "name NOT IN ARRAY('val1', 'val2')"
-        statement = re.sub(
-            r"\bIN\s*\[([^\]]*)\]",
-            r"IN ARRAY(\1)",
-            statement,
+    # Handle bare 'id' references for GQL compatibility
+    upper_stmt = statement.upper()
+    from_pos = upper_stmt.find(" FROM ")
+    if from_pos > 0:
+        select_clause = statement[:from_pos]
+        from_and_rest = statement[from_pos:]
+
+        # Parse SELECT columns and remove id/__key__ from projection
+        select_match = re.match(
+            r"(SELECT\s+(?:DISTINCT\s+(?:ON\s*\([^)]*\)\s*)?)?)(.*)",
+            select_clause,
             flags=re.IGNORECASE,
         )
-        # Convert IN (...) to IN ARRAY(...) but don't double-convert IN ARRAY(...)
-        statement = re.sub(
-            r"\bIN\s*\((?![\s]*SELECT\b)",
-            "IN ARRAY(",
-            statement,
-            flags=re.IGNORECASE,
-        )
-        # Fix double ARRAY: if original was already ARRAY, we'd get IN ARRAY(ARRAY(...)
-        statement = re.sub(
-            r"\bARRAY\s*\(\s*ARRAY\s*\(",
-            "ARRAY(",
-            statement,
-            flags=re.IGNORECASE,
+        if select_match:
+            prefix = select_match.group(1)
+            cols_str = select_match.group(2)
+            cols = [c.strip() for c in cols_str.split(",")]
+            non_key_cols = [
+                c
+                for c in cols
+                if not re.match(
+                    r"^(id|__key__)$", c.strip(), flags=re.IGNORECASE
+                )
+            ]
+
+            if not non_key_cols:
+                select_clause = prefix + "__key__"
+            elif len(non_key_cols) < len(cols):
+                select_clause = prefix + ", ".join(non_key_cols)
+
+        # Convert 'id' to '__key__' in WHERE/ORDER BY/etc.
+        from_and_rest = re.sub(
+            r"\bid\b", "__key__", from_and_rest, flags=re.IGNORECASE
         )
 
-        # 5. Fix WHERE NULL (from sqlglot optimizing "col = NULL" to "NULL")
-        #    sqlglot treats "col = NULL" as always-false and collapses to NULL.
-        #    We can't recover the original column, but if the WHERE clause is
-        #    just "WHERE NULL", remove it since it would return no results.
+        statement = select_clause + from_and_rest
+    else:
         statement = re.sub(
-            r"\bWHERE\s+NULL\b",
-            "",
-            statement,
-            flags=re.IGNORECASE,
+            r"\bid\b", "__key__", statement, flags=re.IGNORECASE
         )
 
-        # === GQL-specific transformations ===
+    # Datastore restriction: projection queries with WHERE clauses require
+    # composite indexes. Convert to SELECT * to avoid this requirement and
+    # let ParseEntity handle column filtering from the full entity response.
+    upper_check = statement.upper()
+    from_check_pos = upper_check.find(" FROM ")
+    where_check_pos = upper_check.find(" WHERE ")
+    if from_check_pos > 0 and where_check_pos > from_check_pos:
+        select_cols_str = re.sub(
+            r"^SELECT\s+", "", statement[:from_check_pos], flags=re.IGNORECASE
+        ).strip()
+        if (
+            select_cols_str != "*"
+            and select_cols_str.upper() != "__KEY__"
+            and not select_cols_str.upper().startswith("DISTINCT")
+        ):
+            statement = "SELECT * " + statement[from_check_pos + 1:]
 
-        # Handle LIMIT FIRST(offset, count) syntax
-        # Convert to LIMIT <count> OFFSET <offset>
-        first_match = re.search(
-            r"LIMIT\s+FIRST\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)",
+    # Handle id = <number> in WHERE clauses -> KEY() syntax
+    if table_name:
+        id_where_match = re.search(
+            r"\bWHERE\b.*\b(?:id|__key__)\s*=\s*(\d+)",
             statement,
             flags=re.IGNORECASE,
         )
-        if first_match:
-            offset = first_match.group(1)
-            count = first_match.group(2)
+        if id_where_match:
+            id_value = id_where_match.group(1)
             statement = re.sub(
-                r"LIMIT\s+FIRST\s*\(\s*\d+\s*,\s*\d+\s*\)",
-                f"LIMIT {count} OFFSET {offset}",
+                r"\b(?:id|__key__)\s*=\s*\d+",
+                f"__key__ = KEY({table_name}, {id_value})",
                 statement,
                 flags=re.IGNORECASE,
             )
 
-        # Extract table name from FROM clause for KEY() conversion
-        table_match = re.search(
-            r"\bFROM\s+(\w+)", statement, flags=re.IGNORECASE
-        )
-        table_name = table_match.group(1) if table_match else None
+    # Remove column aliases (AS alias_name) - GQL doesn't support them
+    # But preserve AS inside AGGREGATE ... AS ... OVER syntax
+    statement = re.sub(
+        r"\bAS\s+\w+", "", statement, flags=re.IGNORECASE
+    )
 
-        # Remove DISTINCT ON (...) syntax - not supported by GQL.
-        # GQL supports DISTINCT but not DISTINCT ON.
+    # Remove table prefix from column names (table.column -> column)
+    if table_name:
         statement = re.sub(
-            r"\bDISTINCT\s+ON\s*\([^)]*\)\s*",
-            "",
-            statement,
-            flags=re.IGNORECASE,
+            rf"\b{table_name}\.(?!__)", "", statement, flags=re.IGNORECASE
         )
 
-        # Convert table.id in SELECT clause to __key__
-        if table_name:
-            statement = re.sub(
-                rf"\b{table_name}\.id\b",
-                "__key__",
-                statement,
-                flags=re.IGNORECASE,
-            )
-
-        # Handle bare 'id' references for GQL compatibility
-        upper_stmt = statement.upper()
-        from_pos = upper_stmt.find(" FROM ")
-        if from_pos > 0:
-            select_clause = statement[:from_pos]
-            from_and_rest = statement[from_pos:]
-
-            # Parse SELECT columns and remove id/__key__ from projection
+    # Clean up extra spaces and artifacts
+    statement = re.sub(r"\s+", " ", statement).strip()
+    statement = re.sub(r",\s*,", ",", statement)
+    statement = re.sub(r"\s*,\s*\bFROM\b", " FROM", statement)
+
+    return statement
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_aggregation_query(statement: str) -> Mapping[str, Any]:
+    """
+    Parse aggregation query and return components.
+    Returns a read-only mapping with:
+    - 'agg_functions': tuple of (func_name, column, alias)
+    - 'base_query': the underlying SELECT query
+    - 'is_aggregate_over': whether it's AGGREGATE...OVER syntax
+    """
+    upper = statement.upper().strip()
+    result: Dict[str, Any] = {
+        "agg_functions": [],
+        "base_query": None,
+        "is_aggregate_over": False,
+    }
+
+    # Handle AGGREGATE ... OVER (SELECT ...) syntax
+    if upper.startswith("AGGREGATE"):
+        result["is_aggregate_over"] = True
+        # Extract the inner SELECT query
+        over_match = re.search(
+            r"OVER\s*\(\s*(SELECT\s+.+)\s*\)\s*$",
+            statement,
+            re.IGNORECASE | re.DOTALL,
+        )
+        if over_match:
+            result["base_query"] = over_match.group(1).strip()
+        else:
+            # Fallback - extract everything after OVER
+            over_idx = upper.find("OVER")
+            if over_idx > 0:
+                # Extract content inside parentheses
+                remaining = statement[over_idx + 4 :].strip()
+                if remaining.startswith("("):
+                    paren_depth = 0
+                    for i, c in enumerate(remaining):
+                        if c == "(":
+                            paren_depth += 1
+                        elif c == ")":
+                            paren_depth -= 1
+                            if paren_depth == 0:
+                                result["base_query"] = remaining[1:i].strip()
+                                break
+
+        # Parse aggregation functions before OVER
+        agg_part = statement[: upper.find("OVER")].strip()
+        if agg_part.upper().startswith("AGGREGATE"):
+            agg_part = agg_part[9:].strip()  # Remove "AGGREGATE"
+        result["agg_functions"] = _extract_agg_functions(agg_part)
+    else:
+        # Handle SELECT COUNT(*), SUM(col), etc.
+        result["is_aggregate_over"] = False
+        # Parse the SELECT clause to extract aggregation functions
+        select_match = re.match(
+            r"SELECT\s+(.+?)\s+FROM\s+(.+)$", statement, re.IGNORECASE | re.DOTALL
+        )
+        if select_match:
+            select_clause = select_match.group(1)
+            from_clause = select_match.group(2)
+            result["agg_functions"] = _extract_agg_functions(select_clause)
+            # Build base query to get all data
+            result["base_query"] = f"SELECT * FROM {from_clause}"
+        else:
+            # Handle SELECT without FROM (e.g., SELECT COUNT(*))
             select_match = re.match(
-                r"(SELECT\s+(?:DISTINCT\s+(?:ON\s*\([^)]*\)\s*)?)?)(.*)",
-                select_clause,
-                flags=re.IGNORECASE,
+                r"SELECT\s+(.+)$", statement, re.IGNORECASE | re.DOTALL
             )
             if select_match:
-                prefix = select_match.group(1)
-                cols_str = select_match.group(2)
-                cols = [c.strip() for c in cols_str.split(",")]
-                non_key_cols = [
-                    c
-                    for c in cols
-                    if not re.match(
-                        r"^(id|__key__)$", c.strip(), flags=re.IGNORECASE
-                    )
-                ]
-
-                if not non_key_cols:
-                    select_clause = prefix + "__key__"
-                elif len(non_key_cols) < len(cols):
-                    select_clause = prefix + ", ".join(non_key_cols)
+                select_clause = select_match.group(1)
+                result["agg_functions"] = _extract_agg_functions(select_clause)
+                result["base_query"] = None  # No base query for kindless
+
+    # The result is shared by every caller of the cache, so freeze it
+    result["agg_functions"] = tuple(result["agg_functions"])
+    return MappingProxyType(result)
+
+
+def _extract_agg_functions(clause: str) -> List[Tuple[str, str, str]]:
+    """Extract aggregation functions from a clause."""
+    functions: List[Tuple[str, str, str]] = []
+    # Pattern to match aggregation functions with optional alias
+    patterns = [
+        (
+            r"COUNT_UP_TO\s*\(\s*(\d+)\s*\)(?:\s+AS\s+(\w+))?",
+            "COUNT_UP_TO",
+        ),
+        (r"COUNT\s*\(\s*\*\s*\)(?:\s+AS\s+(\w+))?", "COUNT"),
+        (r"SUM\s*\(\s*(\w+)\s*\)(?:\s+AS\s+(\w+))?", "SUM"),
+        (r"AVG\s*\(\s*(\w+)\s*\)(?:\s+AS\s+(\w+))?", "AVG"),
+    ]
+
+    for pattern, func_name in patterns:
+        for match in re.finditer(pattern, clause, re.IGNORECASE):
+            if func_name == "COUNT":
+                col = "*"
+                alias = match.group(1) if match.group(1) else func_name
+            elif func_name == "COUNT_UP_TO":
+                col = match.group(1)  # The limit number
+                alias = match.group(2) if match.group(2) else func_name
+            else:
+                col = match.group(1)
+                alias = match.group(2) if match.group(2) else func_name
+            functions.append((func_name, col, alias))
 
-            # Convert 'id' to '__key__' in WHERE/ORDER BY/etc.
-            from_and_rest = re.sub(
-                r"\bid\b", "__key__", from_and_rest, flags=re.IGNORECASE
-            )
+    return functions
 
-            statement = select_clause + from_and_rest
-        else:
-            statement = re.sub(
-                r"\bid\b", "__key__", statement, flags=re.IGNORECASE
-            )
 
-        # Datastore restriction: projection queries with WHERE clauses require
-        # composite indexes. Convert to SELECT * to avoid this requirement and
-        # let ParseEntity handle column filtering from the full entity response.
-        upper_check = statement.upper()
-        from_check_pos = upper_check.find(" FROM ")
-        where_check_pos = upper_check.find(" WHERE ")
-        if from_check_pos > 0 and where_check_pos > from_check_pos:
-            select_cols_str = re.sub(
-                r"^SELECT\s+", "", statement[:from_check_pos], flags=re.IGNORECASE
-            ).strip()
-            if (
-                select_cols_str != "*"
-                and select_cols_str.upper() != "__KEY__"
-                and not select_cols_str.upper().startswith("DISTINCT")
-            ):
-                statement = "SELECT * " + statement[from_check_pos + 1:]
-
-        # Handle id = <number> in WHERE clauses -> KEY() syntax
-        if table_name:
-            id_where_match = re.search(
-                r"\bWHERE\b.*\b(?:id|__key__)\s*=\s*(\d+)",
-                statement,
-                flags=re.IGNORECASE,
-            )
-            if id_where_match:
-                id_value = id_where_match.group(1)
-                statement = re.sub(
-                    r"\b(?:id|__key__)\s*=\s*\d+",
-                    f"__key__ = KEY({table_name}, {id_value})",
-                    statement,
-                    flags=re.IGNORECASE,
-                )
+class RunQuerySession:
+    """The HTTP session for runQuery requests, shared by several connections.
 
-        # Remove column aliases (AS alias_name) - GQL doesn't support them
-        # But preserve AS inside AGGREGATE ... AS ... OVER syntax
-        statement = re.sub(
-            r"\bAS\s+\w+", "", statement, flags=re.IGNORECASE
-        )
+    The dialect gives one of these to every connection it opens, so pooled
+    connections reuse one keep-alive connection and access token. The
+    session is created on first use and released by close().
+    """
 
-        # Remove table prefix from column names (table.column -> column)
-        if table_name:
-            statement = re.sub(
-                rf"\b{table_name}\.(?!__)", "", statement, flags=re.IGNORECASE
+    def __init__(self, client=None):
+        self._client = client
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    def get(self) -> requests.Session:
+        """Return the session, creating it once even under concurrent use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create()
+                session = self._session
+        return session
+
+    def _create(self) -> requests.Session:
+        if os.getenv("DATASTORE_EMULATOR_HOST") is not None:
+            return requests.Session()
+
+        credentials = getattr(self._client, "scoped_credentials", None)
+        if credentials is None and self._client.credentials_info:
+            credentials = service_account.Credentials.from_service_account_info(
+                self._client.credentials_info,
+                scopes=["https://www.googleapis.com/auth/datastore"],
             )
-
-        # Clean up extra spaces and artifacts
-        statement = re.sub(r"\s+", " ", statement).strip()
-        statement = re.sub(r",\s*,", ",", statement)
-        statement = re.sub(r"\s*,\s*\bFROM\b", " FROM", statement)
-
-        return statement
+        if credentials is None:
+            raise ProgrammingError(
+                "No credentials available for Datastore query. "
+                "Provide credentials_info, credentials_path, or "
+                "configure Application Default Credentials."
+            )
+        return AuthorizedSession(credentials)
 
     def close(self):
-        self._closed = True
-        self.connection = None
-        logging.debug("Cursor is closed.")
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
 
 class Connection:
-    def __init__(self, client=None):
+    def __init__(self, client=None, run_query_session=None):
         self._client = client
         self._transaction = None
+        # A connection opened without a shared session owns its own and
+        # closes it with the connection.
+        self._owns_session = run_query_session is None
+        self._run_query_session = run_query_session or RunQuerySession(client)
+
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session for runQuery requests.
+
+        Reusing the session keeps the connection alive between queries and,
+        outside the emulator, reuses the access token.
+        """
+        return self._run_query_session.get()
 
     def cursor(self):
         return Cursor(self)
@@ -2141,197 +2405,219 @@ class Connection:
 
     def close(self):
         logging.debug("Closing connection")
+        if self._owns_session:
+            self._run_query_session.close()
+
+
+def connect(client=None, run_query_session=None):
+    return Connection(client, run_query_session)
+
+
+@functools.lru_cache(maxsize=32)
+def _run_query_url(project_id: str, emulator_host: Optional[str]) -> str:
+    """Return the runQuery endpoint for a project, on the emulator if set."""
+    if emulator_host is None:
+        return f"https://datastore.googleapis.com/v1/projects/{project_id}:runQuery"
+    return f"http://{emulator_host}/v1/projects/{project_id}:runQuery"
+
+
+def _gql_request_body(gql_statement: str) -> dict:
+    """Return a runQuery request body for a GQL statement."""
+    return {"gqlQuery": {"queryString": gql_statement, "allowLiterals": True}}
+
+
+# The common scalar value fields decode with a single builtin call, without
+# going through parse_properties.
+_SCALAR_DECODERS: Dict[Optional[str], Tuple[Any, Any]] = {
+    "integerValue": (int, _types.INTEGER),
+    "doubleValue": (float, _types.FLOAT64),
+    "booleanValue": (bool, _types.BOOL),
+    "stringValue": (str, _types.STRING),
+    "blobValue": (a2b_base64, _types.BYTES),
+}
 
+# Description entry for the entity key column, shared by every result.
+_KEY_FIELD = ("key", None, None, None, None, None, None)
 
-def connect(client=None):
-    return Connection(client)
+# Shared read-only default for entities without a key or properties.
+_EMPTY: Any = MappingProxyType({})
 
 
 class ParseEntity:
     @classmethod
-    def parse(cls, data: dict, selected_columns: Optional[List[str]] = None):
+    def parse(cls, data: List[dict], selected_columns: Optional[List[str]] = None):
         """
         Parse the datastore entity
 
         dict is a json base entity
         selected_columns: List of column names to include in results. If None, include all.
         """
-        all_property_names_set = set()
-        for entity_data in data:
-            properties = entity_data.get("entity", {}).get("properties", {})
-            all_property_names_set.update(properties.keys())
+        columns, final_fields = cls.parse_columns(data, selected_columns)
+        if not columns:
+            return [()] * len(data), final_fields
+        # zip() builds the row tuples in C from the per-column lists.
+        final_rows: List[Tuple] = list(zip(*columns.values(), strict=True))
+        return final_rows, final_fields
+
+    @classmethod
+    def parse_columns(
+        cls, data: List[dict], selected_columns: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, Tuple]]:
+        """
+        Parse the datastore entity into one list of values per column.
 
+        Returns (columns, fields) where columns maps each column name to the
+        list of its values in entity order, and fields holds the matching
+        DB-API description entries.
+        """
         # Determine which columns to include
         if selected_columns is None:
-            # Include all properties if no specific selection
-            sorted_property_names = sorted(list(all_property_names_set))
+            # Include all properties if no specific selection. dict.update()
+            # merges the property names at C level; the values are never read.
+            all_property_names: Dict[str, Any] = {}
+            for entity_data in data:
+                all_property_names.update(
+                    entity_data.get("entity", _EMPTY).get("properties", _EMPTY)
+                )
+            property_names = sorted(all_property_names)
             include_key = True
         else:
-            # Only include selected columns
-            sorted_property_names = []
+            # Only include selected columns, in the order they were selected.
+            # The projection already names the columns, so there is no need
+            # for a separate pass over the entities to discover them; the
+            # ones no entity carries are dropped once the columns are filled.
+            property_names = []
             include_key = False
             for col in selected_columns:
                 if col.lower() == "__key__" or col.lower() == "key":
                     include_key = True
-                elif col in all_property_names_set:
-                    sorted_property_names.append(col)
+                elif col not in property_names:
+                    property_names.append(col)
 
-        final_fields: dict = {}
-        final_rows: List[Tuple] = []
+        final_fields: Dict[str, Tuple] = {}
+        columns: Dict[str, List[Any]] = {}
+        row_count = len(data)
 
         # Add key field if requested
         if include_key:
-            final_fields["key"] = ("key", None, None, None, None, None, None)
-
-        # Add selected fields in the order they appear in selected_columns if provided
-        if selected_columns:
-            # Keep the order from selected_columns
-            for prop_name in selected_columns:
-                if (
-                    prop_name.lower() != "__key__"
-                    and prop_name.lower() != "key"
-                    and prop_name in all_property_names_set
-                ):
-                    final_fields[prop_name] = (
-                        prop_name,
-                        None,
-                        None,
-                        None,
-                        None,
-                        None,
-                        None,
-                    )
-        else:
-            # Add all fields sorted by name
-            for prop_name in sorted_property_names:
+            final_fields["key"] = _KEY_FIELD
+            columns["key"] = [None] * row_count
+
+        # Columns are preallocated with None so missing properties need no write
+        final_fields.update(
+            {
+                prop_name: (prop_name, None, None, None, None, None, None)
+                for prop_name in property_names
+            }
+        )
+        columns.update({prop_name: [None] * row_count for prop_name in property_names})
+
+        # Map each property name to its column list once for this schema.
+        prop_columns = {prop_name: columns[prop_name] for prop_name in property_names}
+        key_column = columns.get("key")
+        parse_properties = ParseEntity.parse_properties
+
+        # Fill the properties column by column, noting each column's first
+        # known type. A column stays None while only unrecognised values have
+        # been seen, so a later row can still fill its type in.
+        column_types: Dict[str, Any] = {}
+        # Bound once so each cell costs a call rather than attribute lookups
+        scalar_decoder = _SCALAR_DECODERS.get
+        known_type = column_types.get
+        for i, entity_data in enumerate(data):
+            ent = entity_data.get("entity", _EMPTY)
+            properties = ent.get("properties", _EMPTY)
+
+            if key_column is not None:
+                key = ent.get("key", _EMPTY)
+                # Only build the empty default when the path is really absent.
+                key_column[i] = key["path"] if "path" in key else []
+
+            # Walk the properties the entity has; absent cells stay None.
+            for prop_name, prop_v in properties.items():
+                column = prop_columns.get(prop_name)
+                if column is None:
+                    continue
+                value_type, raw = next(iter(prop_v.items()), (None, None))
+                scalar = scalar_decoder(value_type)
+                if scalar is not None:
+                    # Scalars convert with a builtin called in place
+                    convert, prop_type = scalar
+                    column[i] = convert(raw)
+                else:
+                    column[i], prop_type = parse_properties(prop_name, prop_v)
+                if known_type(prop_name) is None:
+                    column_types[prop_name] = prop_type
+
+        # Fix up the description types once per column. Selected columns that
+        # no entity carries are dropped.
+        for prop_name in property_names:
+            if prop_name in column_types:
                 final_fields[prop_name] = (
                     prop_name,
-                    None,
+                    column_types[prop_name],
                     None,
                     None,
                     None,
                     None,
                     None,
                 )
+            elif selected_columns is not None:
+                del columns[prop_name]
+                del final_fields[prop_name]
 
-        # Append the properties
-        for entity_data in data:
-            row_values: List[Any] = []
-            properties = entity_data.get("entity", {}).get("properties", {})
-            key = entity_data.get("entity", {}).get("key", {})
-
-            # Add key value if requested
-            if include_key:
-                row_values.append(key.get("path", []))
-
-            # Append selected properties in the correct order
-            if selected_columns:
-                for prop_name in selected_columns:
-                    if prop_name.lower() == "__key__" or prop_name.lower() == "key":
-                        continue  # already added above
-                    if prop_name in all_property_names_set:
-                        prop_v = properties.get(prop_name)
-                        if prop_v is not None:
-                            prop_value, prop_type = ParseEntity.parse_properties(
-                                prop_name, prop_v
-                            )
-                            row_values.append(prop_value)
-                            current_field_info = final_fields[prop_name]
-                            if (
-                                current_field_info[1] is None
-                                or current_field_info[1] == "UNKNOWN"
-                            ):
-                                final_fields[prop_name] = (
-                                    prop_name,
-                                    prop_type,
-                                    current_field_info[2],
-                                    current_field_info[3],
-                                    current_field_info[4],
-                                    current_field_info[5],
-                                    current_field_info[6],
-                                )
-                        else:
-                            row_values.append(None)
-            else:
-                # Append all properties in sorted order
-                for prop_name in sorted_property_names:
-                    prop_v = properties.get(prop_name)
-                    if prop_v is not None:
-                        prop_value, prop_type = ParseEntity.parse_properties(
-                            prop_name, prop_v
-                        )
-                        row_values.append(prop_value)
-                        current_field_info = final_fields[prop_name]
-                        if (
-                            current_field_info[1] is None
-                            or current_field_info[1] == "UNKNOWN"
-                        ):
-                            final_fields[prop_name] = (
-                                prop_name,
-                                prop_type,
-                                current_field_info[2],
-                                current_field_info[3],
-                                current_field_info[4],
-                                current_field_info[5],
-                                current_field_info[6],
-                            )
-                    else:
-                        row_values.append(None)
-
-            final_rows.append(tuple(row_values))
-
-        return final_rows, final_fields
+        return columns, final_fields
 
     @classmethod
     def parse_properties(cls, prop_k: str, prop_v: dict):
-        value_type = next(iter(prop_v), None)
-        prop_type = None
-        prop_value: Any = None
-
-        if value_type == "nullValue" or "nullValue" in prop_v:
-            prop_value = None
-            prop_type = _types.NULL_TYPE
-        elif value_type == "booleanValue" or "booleanValue" in prop_v:
-            prop_value = bool(prop_v["booleanValue"])
-            prop_type = _types.BOOL
-        elif value_type == "integerValue" or "integerValue" in prop_v:
-            prop_value = int(prop_v["integerValue"])
-            prop_type = _types.INTEGER
-        elif value_type == "doubleValue" or "doubleValue" in prop_v:
-            prop_value = float(prop_v["doubleValue"])
-            prop_type = _types.FLOAT64
-        elif value_type == "stringValue" or "stringValue" in prop_v:
-            prop_value = prop_v["stringValue"]
-            prop_type = _types.STRING
-        elif value_type == "timestampValue" or "timestampValue" in prop_v:
-            timestamp_str = prop_v["timestampValue"]
-            if timestamp_str.endswith("Z"):
-                # Handle ISO 8601 with Z suffix (UTC)
-                prop_value = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00")
-                )
+        # The value field and its raw value come out in one step
+        value_type, raw = next(iter(prop_v.items()), (None, None))
+        decoder = _PROPERTY_DECODERS.get(value_type)  # type: ignore[arg-type]
+        if decoder is None:
+            # The value field is not the first key (e.g. excludeFromIndexes
+            # came first); look the remaining keys up in the decoder table.
+            for value_type, raw in prop_v.items():
+                decoder = _PROPERTY_DECODERS.get(value_type)
+                if decoder is not None:
+                    break
             else:
-                prop_value = datetime.fromisoformat(timestamp_str)
-            prop_type = _types.TIMESTAMP
-        elif value_type == "blobValue" or "blobValue" in prop_v:
-            prop_value = base64.b64decode(prop_v.get("blobValue", b""))
-            prop_type = _types.BYTES
-        elif value_type == "geoPointValue" or "geoPointValue" in prop_v:
-            prop_value = prop_v["geoPointValue"]
-            prop_type = _types.GEOPOINT
-        elif value_type == "keyValue" or "keyValue" in prop_v:
-            prop_value = prop_v["keyValue"]["path"]
-            prop_type = _types.KEY_TYPE
-        elif value_type == "arrayValue" or "arrayValue" in prop_v:
-            prop_value = []
-            for entity in prop_v["arrayValue"].get("values", []):
-                e_v, _ = ParseEntity.parse_properties(prop_k, entity)
-                prop_value.append(e_v)
-            prop_type = _types.ARRAY
-        elif value_type == "dictValue" or "dictValue" in prop_v:
-            prop_value = prop_v["dictValue"]
-            prop_type = _types.STRUCT_FIELD_TYPES
-        elif value_type == "entityValue" or "entityValue" in prop_v:
-            prop_value = prop_v["entityValue"].get("properties") or {}
-            prop_type = _types.STRUCT_FIELD_TYPES
-        return prop_value, prop_type
+                return None, None
+        decode, prop_type = decoder
+        return decode(prop_k, raw), prop_type
+
+
+def _decode_timestamp(prop_k: str, timestamp_str: str) -> datetime:
+    if _parse_timestamp is not None:
+        return _parse_timestamp(timestamp_str)
+    if timestamp_str.endswith("Z"):
+        # Handle ISO 8601 with Z suffix (UTC)
+        return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+    return datetime.fromisoformat(timestamp_str)
+
+
+def _decode_array(prop_k: str, array_value: dict) -> list:
+    return [
+        ParseEntity.parse_properties(prop_k, entity)[0]
+        for entity in array_value.get("values", [])
+    ]
+
+
+# Decoder and type for each Datastore value field. A value carries exactly
+# one of these fields, so it is normally found with a single lookup.
+_PROPERTY_DECODERS: Dict[str, Tuple[Any, Any]] = {
+    "nullValue": (lambda prop_k, v: None, _types.NULL_TYPE),
+    "booleanValue": (lambda prop_k, v: bool(v), _types.BOOL),
+    "integerValue": (lambda prop_k, v: int(v), _types.INTEGER),
+    "doubleValue": (lambda prop_k, v: float(v), _types.FLOAT64),
+    "stringValue": (lambda prop_k, v: v, _types.STRING),
+    "timestampValue": (_decode_timestamp, _types.TIMESTAMP),
+    "blobValue": (lambda prop_k, v: a2b_base64(v), _types.BYTES),
+    "geoPointValue": (lambda prop_k, v: v, _types.GEOPOINT),
+    "keyValue": (lambda prop_k, v: v["path"], _types.KEY_TYPE),
+    "arrayValue": (_decode_array, _types.ARRAY),
+    "dictValue": (lambda prop_k, v: v, _types.STRUCT_FIELD_TYPES),
+    "entityValue": (
+        lambda prop_k, v: v.get("properties") or {},
+        _types.STRUCT_FIELD_TYPES,
+    ),
+}
@@ -20,9 +20,12 @@ import logging
 import os
 import shutil
 import signal
+import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Dict
 
 import pytest
 import requests
@@ -30,21 +33,80 @@ from google.cloud import datastore
 from google.cloud.datastore.helpers import GeoPoint
 from sqlalchemy import create_engine
 from sqlalchemy.dialects import registry
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 registry.register("datastore", "sqlalchemy_datastore", "CloudDatastoreDialect")
 
 TEST_PROJECT = "python-datastore-sqlalchemy"
 
+SEED_COUNTS = {"users": 3, "tasks": 3}
+
+
+def _wait_until(condition, description, timeout=30.0):
+    """Poll condition with exponential backoff until it returns True.
+
+    Starts at 50 ms so a fast emulator is picked up almost immediately, and
+    caps the delay at 500 ms. Fails the session once timeout expires.
+    """
+    delay = 0.05
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return
+        if time.monotonic() >= deadline:
+            pytest.fail(f"Timed out after {timeout}s waiting for {description}")
+        logging.info("Waiting for %s...", description)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+
+
+def _emulator_is_up():
+    """Whether the emulator port accepts connections."""
+    host, _, port = os.environ["DATASTORE_EMULATOR_HOST"].rpartition(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+# Engines by URL, so every fixture shares one dialect, client and pool.
+_engines: Dict[str, Engine] = {}
+
+
+def echo_enabled(config):
+    """SQL echo is only worth its logging cost under -vv or PYTEST_ECHO=1."""
+    return config.getoption("verbose") >= 2 or os.environ.get("PYTEST_ECHO") == "1"
+
+
+def get_engine(url=f"datastore://{TEST_PROJECT}", echo=False):
+    """Return the engine for url, creating it on first use."""
+    engine = _engines.get(url)
+    if engine is None:
+        os.environ["DATASTORE_EMULATOR_HOST"] = "localhost:8081"
+        engine = create_engine(url, echo=echo)
+        _engines[url] = engine
+    return engine
+
+
+@pytest.fixture(scope="session")
+def shared_conn(request, test_datasets):
+    """One connection for the whole session, closed when it ends."""
+    with get_engine(echo=echo_enabled(request.config)).connect() as conn:
+        yield conn
+
 
-# Fixture example (add this to your conftest.py)
 @pytest.fixture
-def conn(test_datasets):
-    """Database connection fixture - implement according to your setup"""
-    os.environ["DATASTORE_EMULATOR_HOST"] = "localhost:8081"
-    engine = create_engine(f"datastore://{TEST_PROJECT}", echo=True)
-    conn = engine.connect()
-    return conn
+def conn(shared_conn):
+    """The shared connection, with its transaction ended after each test.
+
+    Datastore writes are applied as they execute, so the rollback only
+    resets SQLAlchemy's transaction state; tests that insert data clean up
+    after themselves.
+    """
+    yield shared_conn
+    shared_conn.rollback()
 
 
 @pytest.fixture(scope="session")
@@ -81,15 +143,7 @@ def datastore_client():
     )
 
     # Wait for the emulator to start.
-    while True:
-        time.sleep(1)
-        try:
-            requests.get(
-                f"http://{os.environ['DATASTORE_EMULATOR_HOST']}/", timeout=10
-            )
-            break
-        except requests.exceptions.ConnectionError:
-            logging.info("Waiting for emulator to spin up...")
+    _wait_until(_emulator_is_up, "emulator to spin up")
     # Create a client that points to the emulator.
     client = datastore.Client(project=TEST_PROJECT)
 
@@ -113,15 +167,37 @@ def datastore_client():
     del os.environ["DATASTORE_EMULATOR_HOST"]
 
 
+def _kind_keys(client, kind):
+    query = client.query(kind=kind)
+    query.keys_only()
+    return [entity.key for entity in query.fetch()]
+
+
 def clear_existing_data(client):
-    for kind in ["users", "tasks", "assessment"]:
-        query = client.query(kind=kind)
-        keys = [entity.key for entity in query.fetch()]
-        if keys:
-            client.delete_multi(keys)
+    kinds = ["users", "tasks", "assessment"]
+    # Fetch the keys of every kind concurrently, then delete them in one call
+    with ThreadPoolExecutor(len(kinds)) as executor:
+        keys = [
+            key
+            for kind_keys in executor.map(lambda kind: _kind_keys(client, kind), kinds)
+            for key in kind_keys
+        ]
+    if keys:
+        client.delete_multi(keys)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(autouse=True)
+def _seed_for_emulator_tests(request):
+    """Seed the emulator before any test that talks to it.
+
+    Tests that use no emulator fixture, such as the unit tests, never start
+    the emulator, so running only those skips its startup.
+    """
+    if "datastore_client" in request.fixturenames:
+        request.getfixturevalue("test_datasets")
+
+
+@pytest.fixture(scope="session")
 def test_datasets(datastore_client):
     client = datastore_client
     clear_existing_data(client)
@@ -172,12 +248,6 @@ def test_datasets(datastore_client):
     user3["settings"] = None
     user3["tags"] = "admin"
 
-    with client.batch() as batch:
-        batch.put(user1)
-        batch.put(user2)
-        batch.put(user3)
-        batch.commit()
-
     # Tasks
     ## task1
     task1 = datastore.Entity(client.key("tasks"))
@@ -236,47 +306,45 @@ def test_datasets(datastore_client):
     task3["hours"] = 3
     task3["property"] = 3
 
-    with client.batch() as batch:
-        batch.put(task1)
-        batch.put(task2)
-        batch.put(task3)
-        batch.commit()
+    # Users and tasks go out in a single commit; the user keys are complete,
+    # so the tasks can reference them before they are written.
+    client.put_multi([user1, user2, user3, task1, task2, task3])
 
     # Wait for batch complete
-    while True:
-        time.sleep(1)
-        query = client.query(kind="users")
-        users = list(query.fetch())
-        if len(users) == 3:
-            break
+    for kind, count in SEED_COUNTS.items():
+        _wait_until(
+            lambda kind=kind, count=count: (
+                len(list(client.query(kind=kind).fetch())) == count
+            ),
+            f"{kind} to be written",
+        )
 
-    query = client.query(kind="users")
-    users = list(query.fetch())
-    assert len(users) == 3
 
-    # Wait for batch complete
-    while True:
-        time.sleep(1)
-        query = client.query(kind="tasks")
-        tasks = list(query.fetch())
-        if len(tasks) == 3:
-            break
+@pytest.fixture(scope="session")
+def seed_cache(datastore_client, test_datasets):
+    """The seeded users and tasks, fetched once per session.
+
+    Tests compare query results against these instead of repeating the
+    seed values, so only the statements under test hit the emulator.
+    """
+    return {
+        kind: list(datastore_client.query(kind=kind).fetch())
+        for kind in SEED_COUNTS
+    }
+
 
-    query = client.query(kind="tasks")
-    tasks = list(query.fetch())
-    assert len(tasks) == 3
+@pytest.fixture(scope="session")
+def engine(request, test_datasets):
+    return get_engine(echo=echo_enabled(request.config))
 
 
 @pytest.fixture(scope="session")
-def engine(test_datasets):
-    os.environ["DATASTORE_EMULATOR_HOST"] = "localhost:8081"
-    engine = create_engine(f"datastore://{TEST_PROJECT}", echo=True)
-    return engine
+def session_factory(engine):
+    return sessionmaker(bind=engine)
 
 
 @pytest.fixture(scope="function")
-def session(engine):
-    session_factory = sessionmaker(bind=engine)
+def session(session_factory):
     sess = session_factory()
     yield sess
     sess.rollback()  # For test isolation
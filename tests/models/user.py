@@ -33,4 +33,11 @@ class User(Base):
     settings = Column(JSON)
 
     def __repr__(self):
-        return f"<User(id={self.id}, name='{self.name}', age='{self.age}', country='{self.country}, create_time='{str(self.create_time)}', description='{self.description}', settings='{self.settings}')>"
+        create_time = self.create_time.isoformat() if self.create_time else None
+        return (f"<User(id={self.id}, "
+                f"name={self.name!r}, "
+                f"age={self.age}, "
+                f"country={self.country!r}, "
+                f"create_time={create_time}, "
+                f"description={self.description!r}, "
+                f"settings={self.settings!r})>")
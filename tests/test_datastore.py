@@ -16,52 +16,126 @@
 # COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-from sqlalchemy import text
+import functools
 
-from sqlalchemy_datastore import CloudDatastoreDialect
-
-
-def test_select_all_users(conn):
-    result = conn.execute(text("SELECT * FROM users"))
-    data = result.fetchall()
-    assert (
-        len(data) == 3
-    ), "Expected 3 rows in the users table, but found a different number."
-
-
-def test_select_users_with_none_result(conn):
-    result = conn.execute(text("SELECT * FROM users where age > 99999999"))
-    data = result.all()
-    assert len(data) == 0, "Should return empty list"
+import pytest
+from models.user import User
+from sqlalchemy import Integer, String, bindparam, select, text
 
-
-def test_select_users_age_gt_20(conn):
-    result = conn.execute(text("SELECT id, name, age FROM users WHERE age > 20"))
-    data = result.fetchall()
-    assert (
-        len(data) == 1
-    ), f"Expected 1 rows with age > 20, but found {len(data)}."
+from sqlalchemy_datastore import CloudDatastoreDialect
 
 
-def test_select_user_named(conn):
-    result = conn.execute(
-        text("SELECT id, name, age FROM users WHERE name = 'Elmerulia Frixell'")
-    )
-    data = result.fetchall()
-    assert (
-        len(data) == 1
-    ), f"Expected 1 row with name 'Elmerulia Frixell', but found {len(data)}."
+@functools.lru_cache(maxsize=64)
+def _stmt(sql):
+    """Return one shared TextClause per SQL string.
+
+    Executing the same clause object lets SQLAlchemy's compiled cache hit
+    without rebuilding the construct for every call.
+    """
+    return text(sql)
+
+
+# Parameterized insert shared by the insert tests, so both reuse one
+# compiled statement from the engine's cache.
+INSERT_USER = text("INSERT INTO users (name, age) VALUES (:name, :age)").bindparams(
+    bindparam("name", type_=String), bindparam("age", type_=Integer)
+)
+
+# Statements whose tests only check how many rows come back, as
+# (sql, expected row count). They are independent, so they run concurrently.
+ROW_COUNT_QUERIES = [
+    pytest.param("SELECT * FROM users", 3, id="select_all_users"),
+    pytest.param(
+        "SELECT * FROM users where age > 99999999", 0, id="users_with_none_result"
+    ),
+    pytest.param(
+        "SELECT id, name, age FROM users WHERE age > 20", 1, id="users_age_gt_20"
+    ),
+    pytest.param(
+        "SELECT id, name, age FROM users WHERE name = 'Elmerulia Frixell'",
+        1,
+        id="user_named",
+    ),
+    pytest.param(
+        "SELECT * FROM users ORDER BY age ASC LIMIT 5", 3, id="order_by_query"
+    ),
+    # 3 rows in total, 2 skipped by the offset
+    pytest.param(
+        "SELECT DISTINCT name, age FROM users WHERE age > 13 "
+        "ORDER BY age DESC LIMIT 10 OFFSET 2",
+        1,
+        id="distinct_name_age_with_conditions",
+    ),
+    # Emulator-compatible compound WHERE; ORDER BY on a property other than
+    # the WHERE ones would need a composite index
+    pytest.param(
+        "SELECT DISTINCT ON (name, age) name, age, country FROM users "
+        "WHERE age >= 15 AND country = 'Arland' LIMIT 20",
+        1,
+        id="compound_query",
+    ),
+    pytest.param(
+        """
+        SELECT
+            task AS task,
+            MAX(reward) AS 'MAX(reward)'
+        FROM
+            ( SELECT *  FROM tasks) AS virtual_table
+        GROUP BY task
+        ORDER BY 'MAX(reward)' DESC
+        LIMIT 10
+        """,
+        3,
+        id="derived_table_query_count_distinct",
+    ),
+    pytest.param(
+        """
+        SELECT
+            name AS name,
+            age AS age,
+            country AS country,
+            create_time AS create_time,
+            description AS description
+        FROM (
+            SELECT * FROM users
+            ) AS virtual_table
+        LIMIT 10
+        """,
+        3,
+        id="derived_table_query_as_virtual_table",
+    ),
+    pytest.param(
+        """
+        SELECT
+            assign_user AS assign_user,
+            MAX(reward) AS 'MAX(reward)'
+        FROM
+            ( SELECT *  FROM tasks) AS virtual_table
+        GROUP BY assign_user
+        ORDER BY 'MAX(reward)' DESC
+        LIMIT 10
+        """,
+        3,
+        id="derived_table_query_with_user_key",
+    ),
+]
+
+
+@pytest.mark.parametrize("sql, expected", ROW_COUNT_QUERIES)
+def test_select_row_count(conn, sql, expected):
+    # Stream the rows rather than materializing a list just to count it
+    count = sum(1 for _ in conn.execute(_stmt(sql)))
+    assert count == expected, f"Expected {expected} rows, got {count} for: {sql}"
 
 
 def test_select_user_keys(conn):
-    result = conn.execute(text("SELECT __key__ FROM users"))
-    data = result.fetchall()
+    result = conn.execute(_stmt("SELECT __key__ FROM users"))
     assert (
-        len(data) == 3
+        sum(1 for _ in result) == 3
     ), "Expected 3 keys in the users table, but found a different number."
 
     result = conn.execute(
-        text(
+        _stmt(
             "SELECT * FROM users WHERE __key__ = KEY(users, 'Elmerulia Frixell_id')"
         )
     )
@@ -69,57 +143,36 @@ def test_select_user_keys(conn):
     assert len(data) == 1, "Expected to find one key for 'Elmerulia Frixell_id'"
 
 
-def test_select_specific_columns(conn):
-    result = conn.execute(text("SELECT name, age FROM users"))
-    data = result.fetchall()
-    assert len(data) == 3, "Expected 3 rows in the users table"
+@pytest.mark.parametrize(
+    "statement",
+    [
+        select(User.name, User.age),
+        _stmt("SELECT users.name, users.age FROM users"),
+    ],
+    ids=["core_select", "fully_qualified_properties"],
+)
+def test_select_name_and_age(conn, seed_cache, statement):
+    names = {user["name"] for user in seed_cache["users"]}
+    ages = {user["age"] for user in seed_cache["users"]}
+    result = conn.execute(statement)
+    data = result.fetchall()
+    assert len(data) == len(seed_cache["users"]), "Expected a row per seeded user"
     for name, age in data:
-        assert name in [
-            "Elmerulia Frixell",
-            "Virginia Robertson",
-            "Travis 'Ghost' Hayes",
-        ], f"Unexpected name: {name}"
-        assert age in [16, 14, 28], f"Unexpected age: {age}"
+        assert name in names, f"Unexpected name: {name}"
+        assert age in ages, f"Unexpected age: {age}"
 
 
-def test_fully_qualified_properties(conn):
-    result = conn.execute(text("SELECT users.name, users.age FROM users"))
+def test_distinct_name_query(conn, seed_cache):
+    result = conn.execute(_stmt("SELECT DISTINCT name FROM users"))
     data = result.fetchall()
-    assert len(data) == 3
-    for name, age in data:
-        assert name in [
-            "Elmerulia Frixell",
-            "Virginia Robertson",
-            "Travis 'Ghost' Hayes",
-        ]
-        assert age in [16, 14, 28]
-
-
-def test_distinct_name_query(conn):
-    result = conn.execute(text("SELECT DISTINCT name FROM users"))
-    data = result.fetchall()
-    assert len(data) == 3
-    for (name,) in data:
-        assert name in [
-            "Elmerulia Frixell",
-            "Virginia Robertson",
-            "Travis 'Ghost' Hayes",
-        ]
-
-
-def test_distinct_name_age_with_conditions(conn):
-    result = conn.execute(
-        text(
-            "SELECT DISTINCT name, age FROM users WHERE age > 13 ORDER BY age DESC LIMIT 10 OFFSET 2"
-        )
+    assert sorted(name for (name,) in data) == sorted(
+        user["name"] for user in seed_cache["users"]
     )
-    data = result.fetchall()
-    assert len(data) == 1, f"Expected 1 row (3 total - 2 offset), got {len(data)}"
 
 
 def test_distinct_on_query(conn):
     result = conn.execute(
-        text("SELECT DISTINCT ON (name) name, age FROM users ORDER BY name, age DESC")
+        _stmt("SELECT DISTINCT ON (name) name, age FROM users ORDER BY name, age DESC")
     )
     data = result.fetchall()
     assert len(data) == 3, f"Expected 3 rows with DISTINCT ON, got {len(data)}"
@@ -128,145 +181,69 @@ def test_distinct_on_query(conn):
     assert data[2][0] == "Virginia Robertson"
 
 
-def test_order_by_query(conn):
-    result = conn.execute(text("SELECT * FROM users ORDER BY age ASC LIMIT 5"))
-    data = result.fetchall()
-    assert len(data) == 3
-
-
-def test_compound_query(conn):
-    # Test compound query with multiple WHERE conditions (emulator-compatible)
-    # Note: ORDER BY on different property than WHERE requires composite index
-    result = conn.execute(
-        text(
-            "SELECT DISTINCT ON (name, age) name, age, country FROM users "
-            "WHERE age >= 15 AND country = 'Arland' LIMIT 20"
-        )
-    )
-    data = result.fetchall()
-    assert len(data) == 1, f"Expected 1 rows, got {len(data)}"
-
-
 def test_aggregate_count(conn):
     result = conn.execute(
-        text(
+        _stmt(
             "AGGREGATE COUNT(*) OVER ( SELECT * FROM tasks WHERE is_done = false AND additional_notes IS NULL )"
         )
     )
-    data = result.fetchall()
-    assert len(data) == 1, "Aggregate should return one row"
-    assert data[0][0] == 2, f"Expected count of 2, got {data[0][0]}"
+    # scalar_one() also fails unless exactly one row comes back
+    count = result.scalar_one()
+    assert count == 2, f"Expected count of 2, got {count}"
 
 
 def test_aggregate_count_up_to(conn):
     result = conn.execute(
-        text(
+        _stmt(
             "AGGREGATE COUNT_UP_TO(5) OVER ( SELECT * FROM tasks WHERE is_done = false AND additional_notes IS NULL )"
         )
     )
-    data = result.fetchall()
-    assert len(data) == 1, "Aggregate should return one row"
-    assert data[0][0] == 2, f"Expected count of 2 (capped at 5), got {data[0][0]}"
-
-
-def test_derived_table_query_count_distinct(conn):
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                task AS task,
-                MAX(reward) AS 'MAX(reward)'
-            FROM
-                ( SELECT *  FROM tasks) AS virtual_table
-            GROUP BY task
-            ORDER BY 'MAX(reward)' DESC
-            LIMIT 10
-            """
-        )
-    )
-    data = result.fetchall()
-    assert len(data) == 3
+    count = result.scalar_one()
+    assert count == 2, f"Expected count of 2 (capped at 5), got {count}"
 
 
-def test_derived_table_query_as_virtual_table(conn):
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                name AS name,
-                age AS age,
-                country AS country,
-                create_time AS create_time,
-                description AS description
-            FROM (
-                SELECT * FROM users
-                ) AS virtual_table
-            LIMIT 10
-            """
-        )
-    )
-    data = result.fetchall()
-    assert len(data) == 3
-
+def delete_inserted_users(client):
+    """Delete any users with numeric IDs in a single call.
 
-def test_derived_table_query_with_user_key(conn):
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                assign_user AS assign_user,
-                MAX(reward) AS 'MAX(reward)'
-            FROM
-                ( SELECT *  FROM tasks) AS virtual_table
-            GROUP BY assign_user
-            ORDER BY 'MAX(reward)' DESC
-            LIMIT 10
-            """
-        )
-    )
-    data = result.fetchall()
-    assert len(data) == 3
+    The seeded users have named keys like "Elmerulia Frixell_id"; inserted
+    entities get auto-generated numeric IDs.
+    """
+    query = client.query(kind="users")
+    query.keys_only()
+    keys = [user.key for user in query.fetch() if user.key.id is not None]
+    if keys:
+        client.delete_multi(keys)
 
 
 def test_insert_data(conn, datastore_client):
     result = conn.execute(
-        text("INSERT INTO users (name, age) VALUES ('Virginia Robertson', 25)")
+        _stmt("INSERT INTO users (name, age) VALUES ('Virginia Robertson', 25)")
     )
     assert result.rowcount == 1
 
     result = conn.execute(
-        text("INSERT INTO users (name, age) VALUES (:name, :age)"),
+        INSERT_USER,
         {"name": "Elmerulia Frixell", "age": 30},
     )
     assert result.rowcount == 1
 
-    # Cleanup: delete any users with numeric IDs (original test data uses named keys)
-    query = datastore_client.query(kind="users")
-    for user in query.fetch():
-        # Original test data uses named keys like "Elmerulia Frixell_id"
-        # Inserted entities get auto-generated numeric IDs
-        if user.key.id is not None:
-            datastore_client.delete(user.key)
+    delete_inserted_users(datastore_client)
 
 
 def test_insert_with_custom_dialect(engine, datastore_client):
-    stmt = text("INSERT INTO users (name, age) VALUES (:name, :age)")
+    stmt = INSERT_USER
     compiled = stmt.compile(dialect=CloudDatastoreDialect())
-    print(str(compiled))  # Optional: only for debug
+    assert str(compiled) == "INSERT INTO users (name, age) VALUES (:name, :age)"
 
     with engine.connect() as conn:
         conn.execute(stmt, {"name": "Elmerulia Frixell", "age": 30})
         conn.commit()
 
-    # Cleanup: delete any users with numeric IDs (original test data uses named keys)
-    query = datastore_client.query(kind="users")
-    for user in query.fetch():
-        if user.key.id is not None:
-            datastore_client.delete(user.key)
+    delete_inserted_users(datastore_client)
 
 
 def test_query_and_process(conn):
-    result = conn.execute(text("SELECT __key__, name, age FROM users"))
+    result = conn.execute(_stmt("SELECT __key__, name, age FROM users"))
     rows = result.fetchall()
-    for row in rows:
-        print(f"Key: {row[0]}, Name: {row[1]}, Age: {row[2]}")
+    assert len(rows) == 3
+    assert all(len(row) == 3 for row in rows)
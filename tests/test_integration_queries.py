@@ -34,6 +34,7 @@ def test_update_user(conn, datastore_client):
     # Find the inserted entity by querying the datastore client directly
     query = datastore_client.query(kind="users")
     query.add_filter("name", "=", "UpdateTestUser")
+    query.keys_only()
     entities = list(query.fetch())
     assert len(entities) >= 1
     entity_id = entities[0].key.id
@@ -63,6 +64,7 @@ def test_delete_user(conn, datastore_client):
     # Find the inserted entity
     query = datastore_client.query(kind="users")
     query.add_filter("name", "=", "DeleteTestUser")
+    query.keys_only()
     entities = list(query.fetch())
     assert len(entities) >= 1
     entity_id = entities[0].key.id
@@ -235,17 +237,45 @@ def test_aggregate_count_with_alias(conn):
 # Derived table queries (additional patterns)
 # ---------------------------------------------------------------------------
 
+# Built once at import so every run executes the same clause objects.
+DERIVED_COUNT_ALL = text(
+    """
+    SELECT
+        COUNT(*) AS cnt
+    FROM (SELECT * FROM users) AS virtual_table
+    """
+)
+
+DERIVED_NAME_AGE = text(
+    """
+    SELECT
+        name AS name,
+        age AS age
+    FROM (SELECT * FROM users) AS virtual_table
+    LIMIT 2
+    """
+)
+
+DERIVED_SUM_REWARD = text(
+    """
+    SELECT
+        SUM(reward) AS total_reward
+    FROM (SELECT * FROM tasks) AS virtual_table
+    """
+)
+
+DERIVED_AVG_REWARD = text(
+    """
+    SELECT
+        AVG(reward) AS avg_reward
+    FROM (SELECT * FROM tasks) AS virtual_table
+    """
+)
+
+
 def test_derived_table_count_all(conn):
     """Test COUNT(*) over derived table."""
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                COUNT(*) AS cnt
-            FROM (SELECT * FROM users) AS virtual_table
-            """
-        )
-    )
+    result = conn.execute(DERIVED_COUNT_ALL)
     data = result.fetchall()
     assert len(data) == 1
     assert data[0][0] == 3
@@ -253,46 +283,20 @@ def test_derived_table_count_all(conn):
 
 def test_derived_table_with_where(conn):
     """Test derived table query with WHERE in subquery."""
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                name AS name,
-                age AS age
-            FROM (SELECT * FROM users) AS virtual_table
-            LIMIT 2
-            """
-        )
-    )
+    result = conn.execute(DERIVED_NAME_AGE)
     data = result.fetchall()
     assert len(data) == 2
 
 
 def test_derived_table_sum_aggregation(conn):
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                SUM(reward) AS total_reward
-            FROM (SELECT * FROM tasks) AS virtual_table
-            """
-        )
-    )
+    result = conn.execute(DERIVED_SUM_REWARD)
     data = result.fetchall()
     assert len(data) == 1
     assert data[0][0] > 0
 
 
 def test_derived_table_avg_aggregation(conn):
-    result = conn.execute(
-        text(
-            """
-            SELECT
-                AVG(reward) AS avg_reward
-            FROM (SELECT * FROM tasks) AS virtual_table
-            """
-        )
-    )
+    result = conn.execute(DERIVED_AVG_REWARD)
     data = result.fetchall()
     assert len(data) == 1
     assert data[0][0] > 0
@@ -333,6 +337,7 @@ def test_task_insert_update_delete_raw_sql(conn, datastore_client):
     # Find the inserted entity
     query = datastore_client.query(kind="tasks")
     query.add_filter("task", "=", "Coverage Test Task")
+    query.keys_only()
     entities = list(query.fetch())
     assert len(entities) >= 1
     entity_id = entities[0].key.id
@@ -19,11 +19,15 @@
 """Unit tests for base.py CloudDatastoreDialect (no emulator required)."""
 from unittest.mock import MagicMock, patch
 
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import registry
 from sqlalchemy.engine.url import make_url
 
-from sqlalchemy_datastore import CloudDatastoreDialect, datastore_dbapi
+from sqlalchemy_datastore import CloudDatastoreDialect, _types, datastore_dbapi
 from sqlalchemy_datastore.parse_url import parse_url
 
+registry.register("datastore", "sqlalchemy_datastore", "CloudDatastoreDialect")
+
 # ---------------------------------------------------------------------------
 # Dialect metadata
 # ---------------------------------------------------------------------------
@@ -36,6 +40,7 @@ def test_dialect_name():
 
 def test_dialect_capabilities():
     d = CloudDatastoreDialect()
+    assert d.supports_statement_cache is True
     assert d.supports_alter is False
     assert d.supports_pk_autoincrement is True
     assert d.supports_sequences is False
@@ -174,6 +179,8 @@ def test_has_table_true():
 
     result = d.has_table(None, "users")
     assert result is True
+    d._client.key.assert_called_once_with("__kind__", "users")
+    d._client.query.return_value.fetch.assert_called_once_with(limit=1)
 
 
 def test_has_table_false():
@@ -218,6 +225,7 @@ def test_get_table_names():
     assert "users" in result
     assert "tasks" in result
     assert "__internal__" not in result
+    d._client.query.return_value.keys_only.assert_called_once_with()
 
 
 def test_get_table_names_empty():
@@ -254,6 +262,28 @@ def test_parse_url_database_with_location():
     assert result[1] == "us-east1"
 
 
+# ---------------------------------------------------------------------------
+# get_columns
+# ---------------------------------------------------------------------------
+
+def test_get_columns_maps_property_types():
+    d = CloudDatastoreDialect()
+    d._client = MagicMock()
+    d._client.query.return_value.fetch.return_value = [
+        {"property_name": "age", "property_type": "Integer"},
+        {"property_name": "shape", "property_type": "Polygon"},
+    ]
+
+    columns = d.get_columns(MagicMock(), "users")
+
+    d._client.query.return_value.add_filter.assert_called_once_with(
+        "kind_name", "=", "users"
+    )
+    assert [c["name"] for c in columns] == ["age", "shape"]
+    assert columns[0]["type"] is _types._property_type["Integer"]
+    assert columns[1]["type"] is _types._property_type["String"]
+
+
 # ---------------------------------------------------------------------------
 # create_connect_args – database parameter
 # ---------------------------------------------------------------------------
@@ -302,3 +332,39 @@ def test_create_connect_args_no_database():
             database=None,
         )
         assert d.database_id is None
+
+
+def test_create_connect_args_builds_client_per_dialect():
+    url = make_url("datastore://my-project/?database=shared-db")
+
+    with patch(
+        "sqlalchemy_datastore.base.create_datastore_client"
+    ) as mock_create:
+        first_client, second_client = MagicMock(), MagicMock()
+        mock_create.side_effect = [
+            (first_client, MagicMock()),
+            (second_client, MagicMock()),
+        ]
+
+        first = CloudDatastoreDialect().create_connect_args(url)
+        second = CloudDatastoreDialect().create_connect_args(url)
+
+        assert first[1]["client"] is first_client
+        assert second[1]["client"] is second_client
+
+
+def test_engine_dispose_closes_run_query_session():
+    with patch(
+        "sqlalchemy_datastore.base.create_datastore_client"
+    ) as mock_create:
+        mock_client = MagicMock()
+        mock_client.project = "my-project"
+        mock_create.return_value = (mock_client, MagicMock())
+        engine = create_engine("datastore://my-project")
+
+    run_query_session = engine.dialect._run_query_session
+    run_query_session._session = MagicMock()
+    http_session = run_query_session._session
+    engine.dispose()
+    http_session.close.assert_called_once_with()
+    assert run_query_session._session is None
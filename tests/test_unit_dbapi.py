@@ -17,11 +17,14 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """Unit tests for datastore_dbapi module internals (no emulator required)."""
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
+from sqlalchemy_datastore import _types
 from sqlalchemy_datastore.datastore_dbapi import (
     Column,
     Connection,
@@ -29,6 +32,7 @@ from sqlalchemy_datastore.datastore_dbapi import (
     Error,
     ParseEntity,
     ProgrammingError,
+    RunQuerySession,
     apilevel,
     connect,
     paramstyle,
@@ -63,6 +67,42 @@ def test_connection_begin_commit_rollback_close():
     conn.close()
 
 
+def test_connections_share_run_query_session(monkeypatch):
+    monkeypatch.setenv("DATASTORE_EMULATOR_HOST", "localhost:8081")
+    client = MagicMock()
+    shared = RunQuerySession(client)
+    first = Connection(client=client, run_query_session=shared)
+    session = first._get_session()
+    assert Connection(client=client, run_query_session=shared)._get_session() is session
+    first.close()
+    assert shared.get() is session
+
+
+def test_connection_closes_own_session(monkeypatch):
+    monkeypatch.setenv("DATASTORE_EMULATOR_HOST", "localhost:8081")
+    conn = Connection(client=MagicMock())
+    session = conn._get_session()
+    assert conn._get_session() is session
+    conn.close()
+    assert conn._run_query_session._session is None
+
+
+def test_run_query_session_created_once_under_concurrency(monkeypatch):
+    monkeypatch.setenv("DATASTORE_EMULATOR_HOST", "localhost:8081")
+    shared = RunQuerySession(MagicMock())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sessions = set(pool.map(lambda _: id(shared.get()), range(32)))
+    assert len(sessions) == 1
+
+
+def test_connection_session_requires_credentials(monkeypatch):
+    monkeypatch.delenv("DATASTORE_EMULATOR_HOST", raising=False)
+    client = MagicMock(scoped_credentials=None, credentials_info=None)
+    conn = Connection(client=client)
+    with pytest.raises(ProgrammingError):
+        conn._get_session()
+
+
 def test_connect_function():
     client = MagicMock()
     conn = connect(client=client)
@@ -209,6 +249,34 @@ def test_is_derived_query_subquery():
     assert cursor._is_derived_query(tokens) is True
 
 
+def test_execute_routes_simple_select_to_gql():
+    cursor = _make_cursor()
+    cursor.gql_query = MagicMock()
+    cursor.execute_orm = MagicMock()
+    cursor.execute("SELECT * FROM users WHERE name = 'select'")
+    cursor.gql_query.assert_called_once()
+    cursor.execute_orm.assert_not_called()
+
+
+def test_execute_routes_derived_query_to_orm():
+    cursor = _make_cursor()
+    cursor.gql_query = MagicMock()
+    cursor.execute_orm = MagicMock()
+    cursor.execute("SELECT * FROM (SELECT * FROM users) AS vt")
+    cursor.execute_orm.assert_called_once()
+    cursor.gql_query.assert_not_called()
+
+
+def test_tokenize_and_parse_cached_by_statement():
+    from sqlalchemy_datastore.datastore_dbapi import (
+        _cached_parse_one,
+        _cached_tokenize,
+    )
+    sql = "SELECT * FROM (SELECT * FROM users) AS vt"
+    assert _cached_tokenize(sql) is _cached_tokenize(sql)
+    assert _cached_parse_one(sql) is _cached_parse_one(sql)
+
+
 # ---------------------------------------------------------------------------
 # Cursor._is_aggregation_query
 # ---------------------------------------------------------------------------
@@ -243,6 +311,17 @@ def test_is_aggregation_query_plain_select():
     assert cursor._is_aggregation_query("SELECT * FROM users") is False
 
 
+def test_gql_query_aggregation_skips_statement_conversion():
+    cursor = _make_cursor()
+    cursor._convert_sql_to_gql = MagicMock()
+    cursor._execute_aggregation_query = MagicMock()
+    cursor.gql_query("SELECT COUNT(*) FROM users")
+    cursor._execute_aggregation_query.assert_called_once_with(
+        "SELECT COUNT(*) FROM users", None
+    )
+    cursor._convert_sql_to_gql.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Cursor._parse_aggregation_query
 # ---------------------------------------------------------------------------
@@ -292,6 +371,15 @@ def test_parse_aggregation_query_avg():
     assert result["agg_functions"][0] == ("AVG", "reward", "avg_reward")
 
 
+def test_parse_aggregation_query_is_cached_per_statement():
+    cursor = _make_cursor()
+    statement = "AGGREGATE COUNT(*) AS n OVER (SELECT * FROM users WHERE age > 20)"
+    first = cursor._parse_aggregation_query(statement)
+    assert _make_cursor()._parse_aggregation_query(statement) is first
+    with pytest.raises(TypeError):
+        first["base_query"] = "SELECT * FROM tasks"
+
+
 # ---------------------------------------------------------------------------
 # Cursor._extract_agg_functions
 # ---------------------------------------------------------------------------
@@ -758,6 +846,43 @@ def test_eval_condition_parentheses():
     assert cursor._eval_condition(context, "(age > 20 AND name = 'Alice')") is True
 
 
+def test_eval_condition_deeply_nested():
+    cursor = _make_cursor()
+    context = {"age": 25, "name": "Alice"}
+    nested = "(" * 2000 + "age > 20" + ")" * 2000
+    assert cursor._eval_condition(context, nested) is True
+    clause = " OR ".join(f"(age = {n} AND name = 'Alice')" for n in range(2000))
+    assert cursor._eval_condition(context, clause) is True
+    assert cursor._eval_condition({"age": 25, "name": "Bob"}, clause) is False
+
+
+def test_apply_client_side_filter_compiles_where_once():
+    cursor = _make_cursor()
+    rows = [(25, "Alice"), (15, "Bob"), (30, "Charlie")]
+    fields = {"age": ("age",), "name": ("name",)}
+    cursor._split_on_operator = MagicMock(wraps=cursor._split_on_operator)
+    result = cursor._apply_client_side_filter(
+        rows, fields, "SELECT * FROM users WHERE age > 20 AND name != 'Bob'"
+    )
+    assert result == [(25, "Alice"), (30, "Charlie")]
+    cursor._split_on_operator.assert_called_once()
+
+
+def test_apply_client_side_filter_fails_closed_on_compile_error():
+    cursor = _make_cursor()
+    cursor._compile_condition = MagicMock(side_effect=ValueError("bad clause"))
+    result = cursor._apply_client_side_filter(
+        [(25, "Alice")], {"age": ("age",), "name": ("name",)},
+        "SELECT * FROM users WHERE age >",
+    )
+    assert result == []
+
+
+def test_evaluate_where_row_length_mismatch():
+    cursor = _make_cursor()
+    assert cursor._evaluate_where(("a", 1), ["name", "age", "x"], "age > 0") is True
+
+
 # ---------------------------------------------------------------------------
 # Cursor._split_on_operator
 # ---------------------------------------------------------------------------
@@ -985,9 +1110,9 @@ def test_is_missing_index_error_true():
     cursor = _make_cursor()
     response = MagicMock()
     response.status_code = 409
-    response.json.return_value = {
+    response.content = json.dumps({
         "error": {"message": "no matching index found", "status": "FAILED_PRECONDITION"}
-    }
+    }).encode()
     assert cursor._is_missing_index_error(response) is True
 
 
@@ -1002,11 +1127,39 @@ def test_is_missing_index_error_bad_json():
     cursor = _make_cursor()
     response = MagicMock()
     response.status_code = 400
-    response.json.side_effect = ValueError
+    response.content = b"<html>no matching index error</html>"
     response.text = "no matching index error"
     assert cursor._is_missing_index_error(response) is True
 
 
+# ---------------------------------------------------------------------------
+# Cursor.executemany
+# ---------------------------------------------------------------------------
+
+def test_executemany_insert_uses_put_multi():
+    cursor = _make_cursor()
+    client = cursor._datastore_client
+    cursor.executemany(
+        "INSERT INTO users (name, age) VALUES (:name, :age)",
+        [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}],
+    )
+    client.put_multi.assert_called_once()
+    client.put.assert_not_called()
+    entities = client.put_multi.call_args[0][0]
+    assert [dict(e) for e in entities] == [
+        {"name": "Alice", "age": 30},
+        {"name": "Bob", "age": 25},
+    ]
+    assert cursor.rowcount == 2
+
+
+def test_executemany_non_insert_runs_each():
+    cursor = _make_cursor()
+    cursor.execute = MagicMock()
+    cursor.executemany("DELETE FROM users WHERE id = :id", [{"id": 1}, {"id": 2}])
+    assert cursor.execute.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Cursor._parse_insert_value
 # ---------------------------------------------------------------------------
@@ -1190,6 +1343,25 @@ def test_parse_properties_timestamp_no_z():
     assert isinstance(val, datetime)
 
 
+def test_parse_properties_timestamp_uses_optional_parser(monkeypatch):
+    from sqlalchemy_datastore import datastore_dbapi
+
+    parsed = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    parser = MagicMock(return_value=parsed)
+    monkeypatch.setattr(datastore_dbapi, "_parse_timestamp", parser)
+    val, _ = ParseEntity.parse_properties(
+        "x", {"timestampValue": "2025-01-01T00:00:00Z"}
+    )
+    assert val is parsed
+    parser.assert_called_once_with("2025-01-01T00:00:00Z")
+
+    monkeypatch.setattr(datastore_dbapi, "_parse_timestamp", None)
+    val, _ = ParseEntity.parse_properties(
+        "x", {"timestampValue": "2025-01-01T00:00:00Z"}
+    )
+    assert val == parsed
+
+
 def test_parse_properties_blob():
     import base64
     encoded = base64.b64encode(b"binary data").decode()
@@ -1252,6 +1424,14 @@ def test_parse_properties_dict():
     assert val == {"key": "value"}
 
 
+def test_parse_properties_value_field_not_first():
+    val, prop_type = ParseEntity.parse_properties(
+        "x", {"excludeFromIndexes": True, "integerValue": "7"}
+    )
+    assert val == 7
+    assert prop_type is not None
+
+
 # ---------------------------------------------------------------------------
 # ParseEntity.parse
 # ---------------------------------------------------------------------------
@@ -1332,6 +1512,48 @@ def test_parse_entity_missing_property():
     assert rows[1][1] is None
 
 
+def test_parse_columns():
+    data = [
+        {
+            "entity": {
+                "key": {"path": [{"kind": "users", "name": "alice"}]},
+                "properties": {
+                    "name": {"stringValue": "Alice"},
+                    "age": {"integerValue": "25"},
+                },
+            }
+        },
+        {
+            "entity": {
+                "key": {"path": [{"kind": "users", "name": "bob"}]},
+                "properties": {"name": {"stringValue": "Bob"}},
+            }
+        },
+    ]
+    columns, fields = ParseEntity.parse_columns(data, None)
+    assert list(columns) == ["key", "age", "name"]
+    assert columns["age"] == [25, None]
+    assert columns["name"] == ["Alice", "Bob"]
+    assert list(fields) == list(columns)
+
+
+def test_parse_entity_type_from_later_row_after_unknown_value():
+    data = [
+        {"entity": {"key": {"path": []}, "properties": {"p": {"weirdValue": 1}}}},
+        {"entity": {"key": {"path": []}, "properties": {"p": {"integerValue": "3"}}}},
+    ]
+    rows, fields = ParseEntity.parse(data, None)
+    assert [row[1] for row in rows] == [None, 3]
+    assert fields["p"][1] is _types.INTEGER
+
+
+def test_parse_entity_no_columns():
+    data = [{"entity": {"key": {"path": []}, "properties": {}}}]
+    rows, fields = ParseEntity.parse(data, ["missing"])
+    assert rows == [()]
+    assert fields == {}
+
+
 # ---------------------------------------------------------------------------
 # Cursor._create_schema_from_df
 # ---------------------------------------------------------------------------
@@ -1414,3 +1636,193 @@ def test_exception_hierarchy():
     assert issubclass(InternalError, DatabaseError)
     assert issubclass(ProgrammingError, DatabaseError)
     assert issubclass(DBWarning, Exception)
+
+
+# ---------------------------------------------------------------------------
+# _gql_request_body
+# ---------------------------------------------------------------------------
+
+def test_gql_request_body_built_per_call():
+    from sqlalchemy_datastore.datastore_dbapi import _gql_request_body
+    first = _gql_request_body("SELECT * FROM users")
+    assert first == {
+        "gqlQuery": {"queryString": "SELECT * FROM users", "allowLiterals": True}
+    }
+    second = _gql_request_body("SELECT * FROM tasks")
+    assert second is not first
+    assert first["gqlQuery"]["queryString"] == "SELECT * FROM users"
+
+
+# ---------------------------------------------------------------------------
+# Cursor.gql_query / execute_orm with a stubbed runQuery response
+# ---------------------------------------------------------------------------
+
+def _run_query_response(entities, query=None, **batch):
+    body = {
+        "batch": {
+            "entityResults": [
+                {
+                    "entity": {
+                        "key": {"path": [{"kind": "users", "name": name}]},
+                        "properties": props,
+                    }
+                }
+                for name, props in entities
+            ],
+            "moreResults": "NO_MORE_RESULTS",
+            **batch,
+        }
+    }
+    if query is not None:
+        body["query"] = query
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(body).encode()
+    return response
+
+
+_USERS = [
+    ("alice", {"name": {"stringValue": "Alice"}, "age": {"integerValue": "30"}}),
+    ("bob", {"name": {"stringValue": "Bob"}, "age": {"integerValue": "25"}}),
+]
+
+
+def test_gql_query_keeps_columns():
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(_USERS)
+    )
+    cursor.gql_query("SELECT * FROM users")
+    assert cursor._query_columns == {
+        "key": [
+            [{"kind": "users", "name": "alice"}],
+            [{"kind": "users", "name": "bob"}],
+        ],
+        "age": [30, 25],
+        "name": ["Alice", "Bob"],
+    }
+    assert cursor.fetchall() == [
+        ([{"kind": "users", "name": "alice"}], 30, "Alice"),
+        ([{"kind": "users", "name": "bob"}], 25, "Bob"),
+    ]
+
+
+def test_execute_orm_from_columns():
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(_USERS)
+    )
+    cursor.execute(
+        "SELECT vt.name AS name, vt.age AS age FROM "
+        "(SELECT * FROM users) AS vt ORDER BY age"
+    )
+    assert [d[0] for d in cursor.description] == ["name", "age"]
+    assert cursor.fetchall() == [("Bob", 25), ("Alice", 30)]
+
+
+def test_execute_orm_plain_projection():
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(_USERS)
+    )
+    cursor.execute(
+        "SELECT vt.name AS username FROM (SELECT * FROM users) AS vt LIMIT 1"
+    )
+    assert [d[0] for d in cursor.description] == ["username"]
+    assert cursor.rowcount == 1
+    assert cursor.fetchall() == [("Alice",)]
+
+
+def test_execute_orm_plain_star():
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(_USERS)
+    )
+    cursor.execute("SELECT * FROM (SELECT * FROM users) AS vt")
+    assert [d[0] for d in cursor.description] == ["key", "age", "name"]
+    assert [row[1:] for row in cursor.fetchall()] == [(30, "Alice"), (25, "Bob")]
+
+
+def test_gql_query_follows_not_finished_batches():
+    cursor = _make_cursor()
+    first = _run_query_response(
+        _USERS[:1],
+        query={"kind": [{"name": "users"}], "limit": 5},
+        moreResults="NOT_FINISHED",
+        endCursor="c1",
+    )
+    cursor._execute_gql_request = MagicMock(return_value=first)
+    cursor._post_run_query = MagicMock(return_value=_run_query_response(_USERS[1:]))
+    cursor.gql_query("SELECT * FROM users LIMIT 5")
+    cursor._post_run_query.assert_called_once_with(
+        {"query": {"kind": [{"name": "users"}], "limit": 4, "startCursor": "c1"}}
+    )
+    assert [row[2] for row in cursor.fetchall()] == ["Alice", "Bob"]
+
+
+def test_execute_orm_computed_column():
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(_USERS)
+    )
+    cursor.execute(
+        'SELECT "age" * 2 AS double_age FROM (SELECT * FROM users) AS vt'
+    )
+    assert [d[0] for d in cursor.description] == ["double_age"]
+    assert cursor.fetchall() == [(60,), (50,)]
+
+
+def test_eval_column_expression_uses_numexpr_when_available(monkeypatch):
+    from sqlalchemy_datastore import datastore_dbapi
+
+    monkeypatch.setattr(datastore_dbapi, "_NUMEXPR_AVAILABLE", True)
+    df = MagicMock()
+    assert datastore_dbapi._eval_column_expression(df, "age * 2") is df.eval.return_value
+    df.eval.assert_called_once_with("age * 2", engine="numexpr")
+
+
+def test_eval_column_expression_python_without_numexpr(monkeypatch):
+    from sqlalchemy_datastore import datastore_dbapi
+
+    monkeypatch.setattr(datastore_dbapi, "_NUMEXPR_AVAILABLE", False)
+    df = MagicMock()
+    assert datastore_dbapi._eval_column_expression(df, "age * 2") is df.eval.return_value
+    df.eval.assert_called_once_with("age * 2", engine="python")
+
+
+def test_eval_column_expression_falls_back_to_python(monkeypatch):
+    import pandas as pd
+
+    from sqlalchemy_datastore import datastore_dbapi
+
+    monkeypatch.setattr(datastore_dbapi, "_NUMEXPR_AVAILABLE", True)
+    # numexpr cannot evaluate object columns (nor run when not installed)
+    df = pd.DataFrame({"name": ["Alice", "Bob"]}, dtype=object)
+    result = datastore_dbapi._eval_column_expression(df, "name + name")
+    assert list(result) == ["AliceAlice", "BobBob"]
+
+
+def test_run_query_url():
+    from sqlalchemy_datastore.datastore_dbapi import _run_query_url
+    assert _run_query_url("p", None) == (
+        "https://datastore.googleapis.com/v1/projects/p:runQuery"
+    )
+    assert _run_query_url("p", "localhost:8081") == (
+        "http://localhost:8081/v1/projects/p:runQuery"
+    )
+
+
+def test_execute_orm_group_by_keeps_every_aggregate():
+    users = _USERS + [
+        ("carol", {"name": {"stringValue": "Alice"}, "age": {"integerValue": "20"}}),
+    ]
+    cursor = _make_cursor()
+    cursor._execute_gql_request = MagicMock(
+        return_value=_run_query_response(users)
+    )
+    cursor.execute(
+        "SELECT vt.name AS name, COUNT(*) AS cnt, MAX(vt.age) AS oldest "
+        "FROM (SELECT * FROM users) AS vt GROUP BY vt.name ORDER BY name"
+    )
+    assert [d[0] for d in cursor.description] == ["name", "cnt", "oldest"]
+    assert cursor.fetchall() == [("Alice", 2, 30), ("Bob", 1, 25)]